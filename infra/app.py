@@ -7,44 +7,35 @@ Simplified CDK application for backup and restore disaster recovery
 import aws_cdk as cdk
 from aws_cdk import Environment
 
+from config import DRConfig
 from stacks.backup_stack import BackupStack
+from stacks.common import add_tags
 from stacks.primary_app import PrimaryAppStack
 from stacks.primary_data import PrimaryDataStack
 from stacks.primary_network import PrimaryNetworkStack
 
+# Config overrides applied when the "dev" context flag is set
+DEV_OVERRIDES = {
+    "nat_gateways": 1,
+}
+
 
 def main():
     app = cdk.App()
 
-    # Get configuration from context
+    # Get configuration from context; DRConfig supplies the defaults
     config = app.node.try_get_context("config") or {}
 
-    # Default configuration for backup and restore
-    default_config = {
-        "primary_region": "ap-southeast-2",
-        "secondary_region": "us-west-2",
-        "db_mode": "rds-postgres",
-        "alarm_email": "admin@example.com",
-        "use_multi_region_kms": True,
-        "rto_target_hours": 4,  # 4 hours RTO
-        "rpo_target_hours": 4,  # 4 hours RPO
-        "domain_name": "app.example.com",
-        "vpc_cidr": "10.0.0.0/16",
-        "ecs_cpu": 256,
-        "ecs_memory": 512,
-        "container_image": "nginx:latest",
-        "container_port": 80,
-        "db_instance_class": "db.t3.micro",
-        "db_allocated_storage": 20,
-        "db_backup_retention": 7,
-    }
-
-    # Merge configurations
-    config = {**default_config, **config}
+    # Dev synths (cdk synth -c dev=true) use a single NAT gateway. Two AZs
+    # stay because the ALB and the RDS subnet group both require them.
+    # Context values from -c arrive as strings, so "false" must not count
+    if str(app.node.try_get_context("dev")).lower() in ("1", "true"):
+        config = {**config, **DEV_OVERRIDES}
+    dr_config = DRConfig.from_dict(config)
 
     # Account and regions
     account = app.account or "820242933814"
-    primary_region = config["primary_region"]
+    primary_region = dr_config.primary_region
 
     # Environment definition (only primary region needed)
     primary_env = Environment(account=account, region=primary_region)
@@ -54,7 +45,7 @@ def main():
         app,
         "PrimaryNetworkStack",
         env=primary_env,
-        config=config,
+        config=dr_config,
         description="Primary region network infrastructure",
     )
 
@@ -63,7 +54,7 @@ def main():
         "PrimaryDataStack",
         vpc=primary_network.vpc,
         env=primary_env,
-        config=config,
+        config=dr_config,
         description="Primary region data infrastructure with backup configuration",
     )
 
@@ -75,7 +66,7 @@ def main():
         database=primary_data.database,
         s3_bucket=primary_data.app_data_bucket,
         env=primary_env,
-        config=config,
+        config=dr_config,
         description="Primary region application infrastructure (workload to backup)",
     )
 
@@ -87,7 +78,7 @@ def main():
         rds_instance=primary_data.database,
         s3_bucket=primary_data.app_data_bucket,
         kms_key=primary_data.kms_key,
-        config=config,
+        config=dr_config,
         env=primary_env,
         description="Backup and restore infrastructure for disaster recovery",
     )
@@ -105,8 +96,7 @@ def main():
     }
 
     for stack in [primary_network, primary_data, primary_app, backup_stack]:
-        for key, value in tags.items():
-            cdk.Tags.of(stack).add(key, value)
+        add_tags(stack, tags)
 
     app.synth()
 
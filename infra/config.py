@@ -0,0 +1,78 @@
+"""
+DR Configuration
+Typed configuration shared by the DR lab stacks.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class DRConfig:
+    """
+    Typed view of the CDK ``config`` context.
+
+    Holds the single source of truth for defaults; unknown keys in the
+    context dictionary are rejected so typos do not silently fall back.
+    """
+
+    primary_region: str = "ap-southeast-2"
+    secondary_region: Optional[str] = "us-west-2"
+    vpc_cidr: str = "10.0.0.0/16"
+    availability_zones: int = 2
+    nat_gateways: int = 2
+    vpc_endpoints: Optional[Tuple[str, ...]] = None
+    flow_logs: bool = True
+    alarm_email: Optional[str] = None
+    ecs_cpu: int = 256
+    ecs_memory: int = 512
+    container_image: str = "nginx:latest"
+    container_port: int = 80
+    environment: str = "Production"
+    project_name: str = "DR Lab"
+    primary_health_check_id: Optional[str] = None
+    health_check_failure_threshold: int = 2
+    health_check_path: str = "/healthz"
+    db_instance_class: str = "db.t3.micro"
+    db_allocated_storage: int = 20
+    db_backup_retention: int = 7
+    s3_replicate_deletes: bool = False
+    s3_lifecycle_glacier_days: int = 90
+    cloudwatch_log_retention_days: int = 14
+    status_provisioned_concurrency: int = 0
+    emit_cfn_outputs: bool = True
+
+    def __post_init__(self) -> None:
+        for name in (
+            "availability_zones",
+            "nat_gateways",
+            "ecs_cpu",
+            "ecs_memory",
+            "container_port",
+            "health_check_failure_threshold",
+            "db_allocated_storage",
+            "db_backup_retention",
+            "s3_lifecycle_glacier_days",
+            "cloudwatch_log_retention_days",
+            "status_provisioned_concurrency",
+        ):
+            value = getattr(self, name)
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(f"{name} must be an int, got {value!r}")
+
+        # An empty secondary region means the same as none: single-region
+        if not self.secondary_region:
+            object.__setattr__(self, "secondary_region", None)
+
+        # Context values arrive as JSON lists; keep the config immutable
+        if self.vpc_endpoints is not None:
+            object.__setattr__(self, "vpc_endpoints", tuple(self.vpc_endpoints))
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "DRConfig":
+        """Build a DRConfig from a context dictionary."""
+        known = {field.name for field in fields(cls)}
+        unknown = set(config) - known
+        if unknown:
+            raise ValueError(f"Unknown config keys: {sorted(unknown)}")
+        return cls(**config)
@@ -3,7 +3,7 @@ BackupPlan Construct
 Simple AWS Backup integration with cross-region copying.
 """
 
-from typing import Optional
+from typing import List, Optional
 
 from aws_cdk import (
     CfnOutput,
@@ -37,7 +37,7 @@ class BackupPlan(Construct):
         construct_id: str,
         *,
         primary_region: str,
-        secondary_region: str,
+        secondary_region: Optional[str],
         kms_key: kms.IKey,
         backup_retention_days: int = 30,
         notification_topic: Optional[sns.ITopic] = None,
@@ -113,16 +113,7 @@ class BackupPlan(Construct):
                     start_window=Duration.hours(1),
                     completion_window=Duration.hours(2),
                     delete_after=Duration.days(self._backup_retention_days),
-                    copy_actions=[
-                        backup.BackupPlanCopyActionProps(
-                            destination_backup_vault=backup.BackupVault.from_backup_vault_name(
-                                self,
-                                "SecondaryVaultRef1",
-                                f"dr-lab-backup-vault-{self._secondary_region}",
-                            ),
-                            delete_after=Duration.days(self._backup_retention_days),
-                        )
-                    ],
+                    copy_actions=self._copy_actions("SecondaryVaultRef1"),
                     recovery_point_tags={
                         "BackupType": "RDS",
                         "Environment": "Production",
@@ -147,16 +138,7 @@ class BackupPlan(Construct):
                     start_window=Duration.hours(1),
                     completion_window=Duration.hours(3),
                     delete_after=Duration.days(self._backup_retention_days),
-                    copy_actions=[
-                        backup.BackupPlanCopyActionProps(
-                            destination_backup_vault=backup.BackupVault.from_backup_vault_name(
-                                self,
-                                "SecondaryVaultRef2",
-                                f"dr-lab-backup-vault-{self._secondary_region}",
-                            ),
-                            delete_after=Duration.days(self._backup_retention_days),
-                        )
-                    ],
+                    copy_actions=self._copy_actions("SecondaryVaultRef2"),
                     recovery_point_tags={
                         "BackupType": "S3",
                         "Environment": "Production",
@@ -166,15 +148,36 @@ class BackupPlan(Construct):
             ],
         )
 
+    def _copy_actions(
+        self, vault_ref_id: str
+    ) -> List[backup.BackupPlanCopyActionProps]:
+        """Copy recovery points to the secondary region vault, if there is one."""
+
+        if not self._secondary_region:
+            return []
+
+        return [
+            backup.BackupPlanCopyActionProps(
+                destination_backup_vault=backup.BackupVault.from_backup_vault_name(
+                    self,
+                    vault_ref_id,
+                    f"dr-lab-backup-vault-{self._secondary_region}",
+                ),
+                delete_after=Duration.days(self._backup_retention_days),
+            )
+        ]
+
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
+        prefix = Stack.of(self).stack_name + "-"
+
         CfnOutput(
             self,
             "PrimaryBackupVaultName",
             value=self._primary_vault.backup_vault_name,
             description="Name of the primary backup vault",
-            export_name=f"{Stack.of(self).stack_name}-PrimaryBackupVaultName",
+            export_name=prefix + "PrimaryBackupVaultName",
         )
 
         CfnOutput(
@@ -182,7 +185,7 @@ class BackupPlan(Construct):
             "PrimaryBackupVaultArn",
             value=self._primary_vault.backup_vault_arn,
             description="ARN of the primary backup vault",
-            export_name=f"{Stack.of(self).stack_name}-PrimaryBackupVaultArn",
+            export_name=prefix + "PrimaryBackupVaultArn",
         )
 
         CfnOutput(
@@ -190,7 +193,7 @@ class BackupPlan(Construct):
             "RDSBackupPlanId",
             value=self._rds_backup_plan.backup_plan_id,
             description="ID of the RDS backup plan",
-            export_name=f"{Stack.of(self).stack_name}-RDSBackupPlanId",
+            export_name=prefix + "RDSBackupPlanId",
         )
 
         CfnOutput(
@@ -198,7 +201,7 @@ class BackupPlan(Construct):
             "S3BackupPlanId",
             value=self._s3_backup_plan.backup_plan_id,
             description="ID of the S3 backup plan",
-            export_name=f"{Stack.of(self).stack_name}-S3BackupPlanId",
+            export_name=prefix + "S3BackupPlanId",
         )
 
     @property
@@ -3,19 +3,25 @@ Deployment Automation Construct
 Lambda functions for automated CloudFormation stack deployment.
 """
 
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Optional
 
-from aws_cdk import (
-    CfnOutput,
-    Duration,
-    Stack,
-)
+from aws_cdk import ArnFormat, CfnOutput, Duration, Stack
 from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as _lambda
 from aws_cdk import aws_s3 as s3
 
 from constructs import Construct
 
+# Handler sources for the deployment automation functions
+_HANDLERS_DIR = str(
+    Path(__file__).resolve().parent.parent / "lambda" / "deployment_automation"
+)
+
+# Lambda allocates CPU with memory; 1769 MB is one full vCPU, which speeds
+# up boto3 imports on the cold start that begins every recovery
+_MEMORY_SIZE = 1769
+
 
 class DeploymentAutomation(Construct):
     """
@@ -34,7 +40,8 @@ class DeploymentAutomation(Construct):
         *,
         template_bucket: s3.IBucket,
         primary_region: str,
-        secondary_region: str,
+        secondary_region: Optional[str],
+        status_provisioned_concurrency: int = 0,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -42,6 +49,7 @@ class DeploymentAutomation(Construct):
         self._template_bucket = template_bucket
         self._primary_region = primary_region
         self._secondary_region = secondary_region
+        self._status_provisioned_concurrency = status_provisioned_concurrency
 
         # Create IAM role
         self._create_deployment_role()
@@ -66,7 +74,22 @@ class DeploymentAutomation(Construct):
             ],
         )
 
-        # CloudFormation permissions
+        stack = Stack.of(self)
+
+        # CloudFormation permissions, limited to stacks in the DR regions.
+        # format_arn uses the stack's partition, so this also works in aws-cn.
+        stack_arns = [
+            stack.format_arn(
+                service="cloudformation",
+                region=region,
+                resource="stack",
+                resource_name="*",
+                arn_format=ArnFormat.SLASH_RESOURCE_NAME,
+            )
+            for region in sorted(
+                {self._primary_region, self._secondary_region} - {None}
+            )
+        ]
         self._deployment_role.add_to_policy(
             iam.PolicyStatement(
                 effect=iam.Effect.ALLOW,
@@ -79,7 +102,7 @@ class DeploymentAutomation(Construct):
                     "cloudformation:DescribeStackResources",
                     "cloudformation:GetTemplate",
                 ],
-                resources=["*"],
+                resources=stack_arns,
             )
         )
 
@@ -96,7 +119,7 @@ class DeploymentAutomation(Construct):
                     "ssm:GetParametersByPath",
                 ],
                 resources=[
-                    f"arn:aws:ssm:{Stack.of(self).region}:{Stack.of(self).account}:parameter/dr-lab/*"
+                    f"arn:aws:ssm:{stack.region}:{stack.account}:parameter/dr-lab/*"
                 ],
             )
         )
@@ -119,176 +142,61 @@ class DeploymentAutomation(Construct):
     def _create_deployment_functions(self) -> None:
         """Create Lambda functions for deployment automation."""
 
-        # Stack deployment function
+        # Both handlers ship in one asset and differ only by handler name
+        code = _lambda.Code.from_asset(_HANDLERS_DIR)
+
+        # Stack deployment function. Recovery settings such as the template
+        # bucket and regions live under /dr-lab/recovery/ in SSM (see
+        # RecoveryParameters); the handler receives everything else in the
+        # event, so no environment variables are set.
         self._stack_deployment_function = _lambda.Function(
             self,
             "StackDeploymentFunction",
-            runtime=_lambda.Runtime.PYTHON_3_9,
-            handler="index.handler",
-            code=_lambda.Code.from_inline(
-                """
-import json
-import boto3
-import logging
-from botocore.exceptions import ClientError
-
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-def handler(event, context):
-    cfn_client = boto3.client('cloudformation')
-    s3_client = boto3.client('s3')
-    ssm_client = boto3.client('ssm')
-    
-    try:
-        # Get deployment parameters
-        stack_name = event['stack_name']
-        template_url = event['template_url']
-        parameters = event.get('parameters', [])
-        
-        logger.info(f"Deploying stack: {stack_name}")
-        logger.info(f"Template URL: {template_url}")
-        
-        # Check if stack exists
-        try:
-            cfn_client.describe_stacks(StackName=stack_name)
-            stack_exists = True
-        except ClientError:
-            stack_exists = False
-        
-        # Create or update stack
-        if stack_exists:
-            response = cfn_client.update_stack(
-                StackName=stack_name,
-                TemplateURL=template_url,
-                Parameters=parameters,
-                Capabilities=['CAPABILITY_IAM']
-            )
-            operation = 'update'
-        else:
-            response = cfn_client.create_stack(
-                StackName=stack_name,
-                TemplateURL=template_url,
-                Parameters=parameters,
-                Capabilities=['CAPABILITY_IAM'],
-                Tags=[
-                    {'Key': 'Project', 'Value': 'DR-Lab'},
-                    {'Key': 'Environment', 'Value': 'Recovery'},
-                    {'Key': 'CreatedBy', 'Value': 'DeploymentAutomation'}
-                ]
-            )
-            operation = 'create'
-        
-        stack_id = response['StackId']
-        
-        logger.info(f"Stack {operation} initiated: {stack_name} ({stack_id})")
-        
-        return {
-            'statusCode': 200,
-            'body': json.dumps({
-                'operation': operation,
-                'stack_name': stack_name,
-                'stack_id': stack_id,
-                'status': 'IN_PROGRESS'
-            })
-        }
-        
-    except Exception as e:
-        logger.error(f"Stack deployment failed: {str(e)}")
-        return {
-            'statusCode': 500,
-            'body': json.dumps({'error': str(e)})
-        }
-"""
-            ),
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            architecture=_lambda.Architecture.ARM_64,
+            memory_size=_MEMORY_SIZE,
+            handler="stack_deployment.handler",
+            code=code,
             role=self._deployment_role,
-            timeout=Duration.seconds(300),
-            environment={
-                "TEMPLATE_BUCKET": self._template_bucket.bucket_name,
-                "PRIMARY_REGION": self._primary_region,
-                "SECONDARY_REGION": self._secondary_region,
-            },
+            # Only starts the stack operation; progress is polled via stack_status
+            timeout=Duration.seconds(30),
         )
 
-        # Stack status checker function
+        # Stack status checker function. It only waits on DescribeStacks, so
+        # it keeps the default memory size instead of a full vCPU.
         self._stack_status_function = _lambda.Function(
             self,
             "StackStatusFunction",
-            runtime=_lambda.Runtime.PYTHON_3_9,
-            handler="index.handler",
-            code=_lambda.Code.from_inline(
-                """
-import json
-import boto3
-import logging
-
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-def handler(event, context):
-    cfn_client = boto3.client('cloudformation')
-    
-    try:
-        stack_name = event['stack_name']
-        
-        # Get stack status
-        response = cfn_client.describe_stacks(StackName=stack_name)
-        stack = response['Stacks'][0]
-        
-        stack_status = stack['StackStatus']
-        
-        # Get stack outputs if available
-        outputs = {}
-        for output in stack.get('Outputs', []):
-            outputs[output['OutputKey']] = output['OutputValue']
-        
-        # Determine if operation is complete
-        complete_statuses = [
-            'CREATE_COMPLETE',
-            'UPDATE_COMPLETE',
-            'CREATE_FAILED',
-            'UPDATE_FAILED',
-            'ROLLBACK_COMPLETE',
-            'UPDATE_ROLLBACK_COMPLETE'
-        ]
-        
-        is_complete = stack_status in complete_statuses
-        is_success = stack_status in ['CREATE_COMPLETE', 'UPDATE_COMPLETE']
-        
-        logger.info(f"Stack {stack_name} status: {stack_status}")
-        
-        return {
-            'statusCode': 200,
-            'body': json.dumps({
-                'stack_name': stack_name,
-                'stack_status': stack_status,
-                'is_complete': is_complete,
-                'is_success': is_success,
-                'outputs': outputs
-            })
-        }
-        
-    except Exception as e:
-        logger.error(f"Stack status check failed: {str(e)}")
-        return {
-            'statusCode': 500,
-            'body': json.dumps({'error': str(e)})
-        }
-"""
-            ),
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            architecture=_lambda.Architecture.ARM_64,
+            handler="stack_status.handler",
+            code=code,
             role=self._deployment_role,
             timeout=Duration.seconds(60),
         )
 
+        # Optionally keep the status checker warm; it is polled throughout a
+        # recovery. Callers should invoke the alias rather than $LATEST.
+        self._stack_status_alias = None
+        if self._status_provisioned_concurrency > 0:
+            self._stack_status_alias = _lambda.Alias(
+                self,
+                "StackStatusLive",
+                alias_name="live",
+                version=self._stack_status_function.current_version,
+                provisioned_concurrent_executions=self._status_provisioned_concurrency,
+            )
+
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
+        # Not exported: nothing imports these, and the owning stack exports
+        # the deployment function ARN itself.
         CfnOutput(
             self,
             "StackDeploymentFunctionArn",
             value=self._stack_deployment_function.function_arn,
             description="ARN of the stack deployment function",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-DeploymentArn",
         )
 
         CfnOutput(
@@ -296,7 +204,6 @@ def handler(event, context):
             "StackStatusFunctionArn",
             value=self._stack_status_function.function_arn,
             description="ARN of the stack status function",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-StatusArn",
         )
 
     @property
@@ -313,3 +220,8 @@ def handler(event, context):
     def stack_status_function(self) -> _lambda.Function:
         """Get the stack status function."""
         return self._stack_status_function
+
+    @property
+    def stack_status_alias(self) -> Optional[_lambda.Alias]:
+        """Get the provisioned status function alias, if one was created."""
+        return self._stack_status_alias
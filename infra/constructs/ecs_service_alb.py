@@ -3,7 +3,7 @@ ECS Service with ALB Construct
 Creates an ECS Fargate service with an associated Application Load Balancer.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from aws_cdk import (
     CfnOutput,
@@ -35,7 +35,7 @@ class ECSServiceALB(Construct):
         *,
         vpc: ec2.Vpc,
         cluster: ecs.Cluster,
-        image: str,
+        image: Union[str, ecs.ContainerImage],
         port: int = 80,
         health_check_path: str = "/healthz",
         task_count: int = 2,
@@ -48,6 +48,7 @@ class ECSServiceALB(Construct):
         kms_key: Optional[kms.IKey] = None,
         enable_logging: bool = True,
         log_retention: logs.RetentionDays = logs.RetentionDays.TWO_WEEKS,
+        target_group_attributes: Optional[Dict[str, str]] = None,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -67,6 +68,7 @@ class ECSServiceALB(Construct):
         self._kms_key = kms_key
         self._enable_logging = enable_logging
         self._log_retention = log_retention
+        self._target_group_attributes = target_group_attributes or {}
 
         # Create security groups
         self._create_security_groups()
@@ -158,6 +160,10 @@ class ECSServiceALB(Construct):
             deregistration_delay=Duration.seconds(30),
         )
 
+        # Apply any additional target group attributes
+        for key, value in self._target_group_attributes.items():
+            self._target_group.set_attribute(key, value)
+
         # Create listener
         self._listener = self._load_balancer.add_listener(
             "Listener",
@@ -218,7 +224,11 @@ class ECSServiceALB(Construct):
         # Create container definition
         container_definition = self._task_definition.add_container(
             "Container",
-            image=ecs.ContainerImage.from_registry(self._image),
+            image=(
+                self._image
+                if isinstance(self._image, ecs.ContainerImage)
+                else ecs.ContainerImage.from_registry(self._image)
+            ),
             memory_limit_mib=self._memory,
             cpu=self._cpu,
             environment=self._environment_variables,
@@ -281,12 +291,14 @@ class ECSServiceALB(Construct):
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
+        prefix = f"{Stack.of(self).stack_name}-{self.node.id}-"
+
         CfnOutput(
             self,
             "LoadBalancerDNS",
             value=self._load_balancer.load_balancer_dns_name,
             description="DNS name of the Application Load Balancer",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-LoadBalancerDNS",
+            export_name=prefix + "LoadBalancerDNS",
         )
 
         CfnOutput(
@@ -294,7 +306,7 @@ class ECSServiceALB(Construct):
             "LoadBalancerArn",
             value=self._load_balancer.load_balancer_arn,
             description="ARN of the Application Load Balancer",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-LoadBalancerArn",
+            export_name=prefix + "LoadBalancerArn",
         )
 
         CfnOutput(
@@ -302,7 +314,7 @@ class ECSServiceALB(Construct):
             "ServiceName",
             value=self._service.service_name,
             description="Name of the ECS service",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-ServiceName",
+            export_name=prefix + "ServiceName",
         )
 
         CfnOutput(
@@ -310,7 +322,7 @@ class ECSServiceALB(Construct):
             "ServiceArn",
             value=self._service.service_arn,
             description="ARN of the ECS service",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-ServiceArn",
+            export_name=prefix + "ServiceArn",
         )
 
     @property
@@ -3,7 +3,7 @@ KMS Multi-Region Key Construct
 Creates and manages multi-region KMS keys for encryption across regions.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from aws_cdk import CfnOutput, Stack
 from aws_cdk import aws_iam as iam
@@ -28,7 +28,7 @@ class KMSMultiRegionKey(Construct):
         alias: str,
         description: str,
         enable_key_rotation: bool = True,
-        replica_regions: Optional[List[str]] = None,
+        replica_regions: Optional[Sequence[str]] = None,
         additional_principals: Optional[List[iam.IPrincipal]] = None,
         **kwargs,
     ) -> None:
@@ -171,12 +171,15 @@ class KMSMultiRegionKey(Construct):
 
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs for the key."""
+
+        prefix = f"{Stack.of(self).stack_name}-{self._alias}-"
+
         CfnOutput(
             self,
             "KeyId",
             value=self._key.key_id,
             description=f"KMS Key ID for {self._alias}",
-            export_name=f"{Stack.of(self).stack_name}-{self._alias}-KeyId",
+            export_name=prefix + "KeyId",
         )
 
         CfnOutput(
@@ -184,7 +187,7 @@ class KMSMultiRegionKey(Construct):
             "KeyArn",
             value=self._key.key_arn,
             description=f"KMS Key ARN for {self._alias}",
-            export_name=f"{Stack.of(self).stack_name}-{self._alias}-KeyArn",
+            export_name=prefix + "KeyArn",
         )
 
         CfnOutput(
@@ -192,7 +195,7 @@ class KMSMultiRegionKey(Construct):
             "AliasName",
             value=self._alias_obj.alias_name,
             description=f"KMS Key Alias for {self._alias}",
-            export_name=f"{Stack.of(self).stack_name}-{self._alias}-AliasName",
+            export_name=prefix + "AliasName",
         )
 
     @property
@@ -283,12 +283,14 @@ class RDSWithReplica(Construct):
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
+        prefix = f"{Stack.of(self).stack_name}-{self.node.id}-"
+
         CfnOutput(
             self,
             "PrimaryInstanceEndpoint",
             value=self._primary_instance.instance_endpoint.hostname,
             description="Primary database instance endpoint",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-PrimaryEndpoint",
+            export_name=prefix + "PrimaryEndpoint",
         )
 
         CfnOutput(
@@ -296,7 +298,7 @@ class RDSWithReplica(Construct):
             "PrimaryInstancePort",
             value=str(self._primary_instance.instance_endpoint.port),
             description="Primary database instance port",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-PrimaryPort",
+            export_name=prefix + "PrimaryPort",
         )
 
         CfnOutput(
@@ -304,7 +306,7 @@ class RDSWithReplica(Construct):
             "PrimaryInstanceIdentifier",
             value=self._primary_instance.instance_identifier,
             description="Primary database instance identifier",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-PrimaryIdentifier",
+            export_name=prefix + "PrimaryIdentifier",
         )
 
         CfnOutput(
@@ -312,7 +314,7 @@ class RDSWithReplica(Construct):
             "DatabaseName",
             value=self._database_name,
             description="Database name",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-DatabaseName",
+            export_name=prefix + "DatabaseName",
         )
 
         CfnOutput(
@@ -320,7 +322,7 @@ class RDSWithReplica(Construct):
             "CredentialsSecretArn",
             value=self._primary_instance.secret.secret_arn,
             description="ARN of the database credentials secret",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-CredentialsSecretArn",
+            export_name=prefix + "CredentialsSecretArn",
         )
 
     @property
@@ -104,12 +104,14 @@ class RecoveryParameters(Construct):
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
+        prefix = f"{Stack.of(self).stack_name}-{self.node.id}-"
+
         CfnOutput(
             self,
             "ParameterPathPrefix",
             value="/dr-lab/",
             description="SSM parameter path prefix for DR lab configuration",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-PathPrefix",
+            export_name=prefix + "PathPrefix",
         )
 
         CfnOutput(
@@ -117,7 +119,7 @@ class RecoveryParameters(Construct):
             "RecoveryParameterPath",
             value="/dr-lab/recovery/",
             description="SSM parameter path for recovery configuration",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-RecoveryPath",
+            export_name=prefix + "RecoveryPath",
         )
 
         CfnOutput(
@@ -125,7 +127,7 @@ class RecoveryParameters(Construct):
             "OperationalParameterPath",
             value="/dr-lab/operational/",
             description="SSM parameter path for operational configuration",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-OperationalPath",
+            export_name=prefix + "OperationalPath",
         )
 
     @property
@@ -32,7 +32,7 @@ class S3ReplicationPair(Construct):
         construct_id: str,
         *,
         source_region: str,
-        destination_region: str,
+        destination_region: Optional[str],
         bucket_name_prefix: str,
         versioned: bool = True,
         replicate_deletes: bool = False,
@@ -56,17 +56,24 @@ class S3ReplicationPair(Construct):
         self._enable_access_logging = enable_access_logging
         self._access_log_bucket = access_log_bucket
 
+        # Without a destination region (e.g. dev) only the source bucket is
+        # created; there is no replication role or configuration
+        self._replication_role = None
+        self._destination_bucket_config = None
+
         # Create replication role
-        self._create_replication_role()
+        if self._destination_region:
+            self._create_replication_role()
 
         # Create source bucket
         self._create_source_bucket()
 
-        # Create destination bucket (conceptually - actual creation happens in destination region)
-        self._create_destination_bucket_config()
+        if self._destination_region:
+            # Create destination bucket (conceptually - actual creation happens in destination region)
+            self._create_destination_bucket_config()
 
-        # Configure replication
-        self._configure_replication()
+            # Configure replication
+            self._configure_replication()
 
         # Create access logging bucket if needed
         if self._enable_access_logging and not self._access_log_bucket:
@@ -270,12 +277,14 @@ class S3ReplicationPair(Construct):
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
+        prefix = f"{Stack.of(self).stack_name}-{self.node.id}-"
+
         CfnOutput(
             self,
             "SourceBucketName",
             value=self._source_bucket.bucket_name,
             description="Name of the source S3 bucket",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-SourceBucketName",
+            export_name=prefix + "SourceBucketName",
         )
 
         CfnOutput(
@@ -283,24 +292,25 @@ class S3ReplicationPair(Construct):
             "SourceBucketArn",
             value=self._source_bucket.bucket_arn,
             description="ARN of the source S3 bucket",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-SourceBucketArn",
+            export_name=prefix + "SourceBucketArn",
         )
 
-        CfnOutput(
-            self,
-            "DestinationBucketName",
-            value=self._destination_bucket_config["bucket_name"],
-            description="Name of the destination S3 bucket",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-DestinationBucketName",
-        )
+        if self._destination_region:
+            CfnOutput(
+                self,
+                "DestinationBucketName",
+                value=self._destination_bucket_config["bucket_name"],
+                description="Name of the destination S3 bucket",
+                export_name=prefix + "DestinationBucketName",
+            )
 
-        CfnOutput(
-            self,
-            "ReplicationRoleArn",
-            value=self._replication_role.role_arn,
-            description="ARN of the S3 replication role",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-ReplicationRoleArn",
-        )
+            CfnOutput(
+                self,
+                "ReplicationRoleArn",
+                value=self._replication_role.role_arn,
+                description="ARN of the S3 replication role",
+                export_name=prefix + "ReplicationRoleArn",
+            )
 
         if hasattr(self, "_access_log_bucket") and self._access_log_bucket:
             CfnOutput(
@@ -308,7 +318,7 @@ class S3ReplicationPair(Construct):
                 "AccessLogBucketName",
                 value=self._access_log_bucket.bucket_name,
                 description="Name of the access log bucket",
-                export_name=f"{Stack.of(self).stack_name}-{self.node.id}-AccessLogBucketName",
+                export_name=prefix + "AccessLogBucketName",
             )
 
     @property
@@ -317,13 +327,13 @@ class S3ReplicationPair(Construct):
         return self._source_bucket
 
     @property
-    def destination_bucket_config(self) -> Dict:
-        """Get the destination bucket configuration."""
+    def destination_bucket_config(self) -> Optional[Dict]:
+        """Get the destination bucket configuration, if replicating."""
         return self._destination_bucket_config
 
     @property
-    def replication_role(self) -> iam.Role:
-        """Get the replication IAM role."""
+    def replication_role(self) -> Optional[iam.Role]:
+        """Get the replication IAM role, if replicating."""
         return self._replication_role
 
     @property
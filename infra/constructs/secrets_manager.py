@@ -7,7 +7,6 @@ from typing import Dict, Optional
 
 from aws_cdk import (
     CfnOutput,
-    Duration,
     RemovalPolicy,
     Stack,
 )
@@ -148,12 +147,14 @@ class SecretsManager(Construct):
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
+        prefix = Stack.of(self).stack_name + "-"
+
         CfnOutput(
             self,
             "AppConfigSecretArn",
             value=self._app_config_secret.secret_arn,
             description="ARN of the application configuration secret",
-            export_name=f"{Stack.of(self).stack_name}-AppConfigSecretArn",
+            export_name=prefix + "AppConfigSecretArn",
         )
 
         CfnOutput(
@@ -161,7 +162,7 @@ class SecretsManager(Construct):
             "DatabaseConfigSecretArn",
             value=self._db_config_secret.secret_arn,
             description="ARN of the database configuration secret",
-            export_name=f"{Stack.of(self).stack_name}-DatabaseConfigSecretArn",
+            export_name=prefix + "DatabaseConfigSecretArn",
         )
 
         CfnOutput(
@@ -169,7 +170,7 @@ class SecretsManager(Construct):
             "ApiKeysSecretArn",
             value=self._api_keys_secret.secret_arn,
             description="ARN of the API keys secret",
-            export_name=f"{Stack.of(self).stack_name}-ApiKeysSecretArn",
+            export_name=prefix + "ApiKeysSecretArn",
         )
 
     def grant_read_access(self, grantee: iam.IGrantable, secret_name: str) -> iam.Grant:
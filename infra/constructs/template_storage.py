@@ -92,12 +92,15 @@ class TemplateStorage(Construct):
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
+        prefix = f"{Stack.of(self).stack_name}-{self.node.id}-"
+        bucket_name = self._template_bucket.bucket_name
+
         CfnOutput(
             self,
             "TemplateBucketName",
-            value=self._template_bucket.bucket_name,
+            value=bucket_name,
             description="Name of the recovery templates bucket",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-BucketName",
+            export_name=prefix + "BucketName",
         )
 
         CfnOutput(
@@ -105,7 +108,7 @@ class TemplateStorage(Construct):
             "TemplateBucketArn",
             value=self._template_bucket.bucket_arn,
             description="ARN of the recovery templates bucket",
-            export_name=f"{Stack.of(self).stack_name}-{self.node.id}-BucketArn",
+            export_name=prefix + "BucketArn",
         )
 
         # Template URLs
@@ -116,9 +119,9 @@ class TemplateStorage(Construct):
             CfnOutput(
                 self,
                 f"{template_name}TemplateUrl",
-                value=f"https://{self._template_bucket.bucket_name}.s3.amazonaws.com/templates/{template_file}",
+                value=f"https://{bucket_name}.s3.amazonaws.com/templates/{template_file}",
                 description=f"URL of the {template_name.lower()} recovery template",
-                export_name=f"{Stack.of(self).stack_name}-{self.node.id}-{template_name}Url",
+                export_name=f"{prefix}{template_name}Url",
             )
 
     @property
@@ -0,0 +1,82 @@
+"""
+Stack Deployment Handler
+Creates or updates a recovery CloudFormation stack from a template URL.
+"""
+
+import json
+import logging
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Created once per execution environment and reused by warm invocations.
+# Bounded retries keep a degraded API from stalling the caller.
+cfn_client = boto3.client(
+    "cloudformation",
+    config=Config(retries={"mode": "standard", "total_max_attempts": 2}),
+)
+
+
+def handler(event, context):
+    try:
+        # Get deployment parameters
+        stack_name = event["stack_name"]
+        template_url = event["template_url"]
+        parameters = event.get("parameters", [])
+
+        logger.info(f"Deploying stack: {stack_name}")
+        logger.info(f"Template URL: {template_url}")
+
+        # Check if stack exists
+        try:
+            cfn_client.describe_stacks(StackName=stack_name)
+            stack_exists = True
+        except ClientError:
+            stack_exists = False
+
+        # Create or update stack
+        if stack_exists:
+            response = cfn_client.update_stack(
+                StackName=stack_name,
+                TemplateURL=template_url,
+                Parameters=parameters,
+                Capabilities=["CAPABILITY_IAM"],
+            )
+            operation = "update"
+        else:
+            response = cfn_client.create_stack(
+                StackName=stack_name,
+                TemplateURL=template_url,
+                Parameters=parameters,
+                Capabilities=["CAPABILITY_IAM"],
+                Tags=[
+                    {"Key": "Project", "Value": "DR-Lab"},
+                    {"Key": "Environment", "Value": "Recovery"},
+                    {"Key": "CreatedBy", "Value": "DeploymentAutomation"},
+                ],
+            )
+            operation = "create"
+
+        stack_id = response["StackId"]
+
+        logger.info(f"Stack {operation} initiated: {stack_name} ({stack_id})")
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps(
+                {
+                    "operation": operation,
+                    "stack_name": stack_name,
+                    "stack_id": stack_id,
+                    "status": "IN_PROGRESS",
+                }
+            ),
+        }
+
+    except Exception as e:
+        logger.error(f"Stack deployment failed: {str(e)}")
+        return {"statusCode": 500, "body": json.dumps({"error": str(e)})}
@@ -0,0 +1,68 @@
+"""
+Stack Status Handler
+Reports the status and outputs of a recovery CloudFormation stack.
+"""
+
+import json
+import logging
+
+import boto3
+from botocore.config import Config
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Created once per execution environment and reused by warm invocations.
+# Bounded retries keep a degraded API from stalling the caller.
+cfn_client = boto3.client(
+    "cloudformation",
+    config=Config(retries={"mode": "standard", "total_max_attempts": 2}),
+)
+
+
+def handler(event, context):
+    try:
+        stack_name = event["stack_name"]
+
+        # Get stack status
+        response = cfn_client.describe_stacks(StackName=stack_name)
+        stack = response["Stacks"][0]
+
+        stack_status = stack["StackStatus"]
+
+        # Get stack outputs if available
+        outputs = {}
+        for output in stack.get("Outputs", []):
+            outputs[output["OutputKey"]] = output["OutputValue"]
+
+        # Determine if operation is complete
+        complete_statuses = [
+            "CREATE_COMPLETE",
+            "UPDATE_COMPLETE",
+            "CREATE_FAILED",
+            "UPDATE_FAILED",
+            "ROLLBACK_COMPLETE",
+            "UPDATE_ROLLBACK_COMPLETE",
+        ]
+
+        is_complete = stack_status in complete_statuses
+        is_success = stack_status in ["CREATE_COMPLETE", "UPDATE_COMPLETE"]
+
+        logger.info(f"Stack {stack_name} status: {stack_status}")
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps(
+                {
+                    "stack_name": stack_name,
+                    "stack_status": stack_status,
+                    "is_complete": is_complete,
+                    "is_success": is_success,
+                    "outputs": outputs,
+                }
+            ),
+        }
+
+    except Exception as e:
+        logger.error(f"Stack status check failed: {str(e)}")
+        return {"statusCode": 500, "body": json.dumps({"error": str(e)})}
@@ -3,19 +3,12 @@ Backup Stack
 Simple backup and restore capabilities for DR lab.
 """
 
-from typing import Dict
+from typing import TYPE_CHECKING
 
-from aws_cdk import (
-    CfnOutput,
-    Stack,
-    Tags,
-)
-from aws_cdk import aws_ec2 as ec2
-from aws_cdk import aws_rds as rds
-from aws_cdk import aws_s3 as s3
+from aws_cdk import Stack
 from aws_cdk import aws_sns as sns
-from aws_cdk import aws_sns_subscriptions as subs
 
+from config import DRConfig
 from constructs import Construct
 from constructs.backup_plan import BackupPlan
 from constructs.deployment_automation import DeploymentAutomation
@@ -23,6 +16,17 @@ from constructs.kms_multi_region_key import KMSMultiRegionKey
 from constructs.recovery_parameters import RecoveryParameters
 from constructs.secrets_manager import SecretsManager
 from constructs.template_storage import TemplateStorage
+from stacks.common import add_email_subscription, add_outputs, add_tags
+
+if TYPE_CHECKING:
+    from aws_cdk import aws_ec2 as ec2
+    from aws_cdk import aws_rds as rds
+    from aws_cdk import aws_s3 as s3
+
+# Outputs other stacks or accounts consume; the rest are for humans only
+_EXPORTED_OUTPUTS = frozenset(
+    {"BackupVaultName", "RecoveryTemplateBucket", "DeploymentFunctionArn"}
+)
 
 
 class BackupStack(Stack):
@@ -41,11 +45,11 @@ class BackupStack(Stack):
         scope: Construct,
         construct_id: str,
         *,
-        primary_vpc: ec2.Vpc,
-        rds_instance: rds.DatabaseInstance,
-        s3_bucket: s3.Bucket,
+        primary_vpc: "ec2.Vpc",
+        rds_instance: "rds.DatabaseInstance",
+        s3_bucket: "s3.Bucket",
         kms_key: KMSMultiRegionKey,
-        config: Dict,
+        config: DRConfig,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -56,6 +60,12 @@ class BackupStack(Stack):
         self._kms_key = kms_key
         self._config = config
 
+        # Region recovery deploys into; a single-region setup (e.g. dev)
+        # recovers in place
+        self._recovery_region = config.secondary_region or config.primary_region
+
+        # Deployment automation and recovery parameters need the template bucket
+
         # Create notification topic
         self._create_notification_topic()
 
@@ -86,6 +96,12 @@ class BackupStack(Stack):
     def _create_notification_topic(self) -> None:
         """Create SNS topic for backup notifications."""
 
+        # The topic's only consumer is the email subscription; without an
+        # address there is nobody to notify, so skip the resource entirely
+        self._notification_topic = None
+        if not self._config.alarm_email:
+            return
+
         self._notification_topic = sns.Topic(
             self,
             "BackupNotificationTopic",
@@ -93,12 +109,7 @@ class BackupStack(Stack):
             topic_name="dr-lab-backup-notifications",
         )
 
-        # Add email subscription if configured
-        alarm_email = self._config.get("alarm_email")
-        if alarm_email:
-            self._notification_topic.add_subscription(
-                subs.EmailSubscription(alarm_email)
-            )
+        add_email_subscription(self._notification_topic, self._config.alarm_email)
 
     def _create_backup_plan(self) -> None:
         """Create AWS Backup plan with cross-region copying."""
@@ -106,8 +117,8 @@ class BackupStack(Stack):
         self._backup_plan = BackupPlan(
             self,
             "BackupPlan",
-            primary_region=self._config.get("primary_region", "ap-southeast-2"),
-            secondary_region=self._config.get("secondary_region", "us-west-2"),
+            primary_region=self._config.primary_region,
+            secondary_region=self._config.secondary_region,
             kms_key=self._kms_key.key,
             backup_retention_days=30,
             notification_topic=self._notification_topic,
@@ -119,7 +130,7 @@ class BackupStack(Stack):
         self._template_storage = TemplateStorage(
             self,
             "TemplateStorage",
-            region=self._config.get("secondary_region", "us-west-2"),
+            region=self._recovery_region,
             template_files=[
                 "network-template.json",
                 "application-template.json",
@@ -133,7 +144,9 @@ class BackupStack(Stack):
             self,
             "SecretsManager",
             kms_key=self._kms_key.key,
-            replica_regions=[self._config.get("secondary_region", "us-west-2")],
+            replica_regions=[
+                region for region in (self._config.secondary_region,) if region
+            ],
         )
 
     def _create_deployment_automation(self) -> None:
@@ -143,8 +156,9 @@ class BackupStack(Stack):
             self,
             "DeploymentAutomation",
             template_bucket=self._template_storage.template_bucket,
-            primary_region=self._config.get("primary_region", "ap-southeast-2"),
-            secondary_region=self._config.get("secondary_region", "us-west-2"),
+            primary_region=self._config.primary_region,
+            secondary_region=self._config.secondary_region,
+            status_provisioned_concurrency=self._config.status_provisioned_concurrency,
         )
 
     def _create_recovery_parameters(self) -> None:
@@ -153,14 +167,14 @@ class BackupStack(Stack):
         self._recovery_parameters = RecoveryParameters(
             self,
             "RecoveryParameters",
-            primary_region=self._config.get("primary_region", "ap-southeast-2"),
-            secondary_region=self._config.get("secondary_region", "us-west-2"),
+            primary_region=self._config.primary_region,
+            secondary_region=self._recovery_region,
             vpc_cidr="10.1.0.0/16",  # Different CIDR for recovery environment
             availability_zones=2,
-            ecs_cpu=self._config.get("ecs_cpu", 256),
-            ecs_memory=self._config.get("ecs_memory", 512),
-            container_image=self._config.get("container_image", "nginx:latest"),
-            container_port=self._config.get("container_port", 80),
+            ecs_cpu=self._config.ecs_cpu,
+            ecs_memory=self._config.ecs_memory,
+            container_image=self._config.container_image,
+            container_port=self._config.container_port,
             template_bucket_name=self._template_storage.bucket_name,
         )
 
@@ -182,56 +196,60 @@ class BackupStack(Stack):
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
-        # Backup outputs
-        CfnOutput(
-            self,
-            "BackupVaultName",
-            value=self._backup_plan.primary_backup_vault.backup_vault_name,
-            description="Name of the primary backup vault",
-            export_name=f"{self.stack_name}-BackupVaultName",
-        )
-
-        # Recovery outputs
-        CfnOutput(
-            self,
-            "RecoveryTemplateBucket",
-            value=self._template_storage.bucket_name,
-            description="Name of the recovery templates bucket",
-            export_name=f"{self.stack_name}-RecoveryTemplateBucket",
-        )
-
-        CfnOutput(
-            self,
-            "DeploymentFunctionArn",
-            value=self._deployment_automation.stack_deployment_function.function_arn,
-            description="ARN of the deployment automation function",
-            export_name=f"{self.stack_name}-DeploymentFunctionArn",
+        vault_name = self._backup_plan.primary_backup_vault.backup_vault_name
+        deployment_function = self._deployment_automation.stack_deployment_function
+
+        outputs = (
+            # Backup outputs
+            ("BackupVaultName", vault_name, "Name of the primary backup vault"),
+            # Recovery outputs
+            (
+                "RecoveryTemplateBucket",
+                self._template_storage.bucket_name,
+                "Name of the recovery templates bucket",
+            ),
+            (
+                "DeploymentFunctionArn",
+                deployment_function.function_arn,
+                "ARN of the deployment automation function",
+            ),
+            # Recovery instructions, one step per output
+            (
+                "RecoveryStep1BackupVault",
+                vault_name,
+                "Recovery step 1: restore from this backup vault",
+            ),
+            (
+                "RecoveryStep2TemplateBucket",
+                self._template_storage.bucket_name,
+                "Recovery step 2: deploy templates from this bucket",
+            ),
+            (
+                "RecoveryStep3DeployFn",
+                deployment_function.function_name,
+                "Recovery step 3: run this deployment function",
+            ),
+            # Cost summary
+            (
+                "CostSummary",
+                "Backup & Restore pattern: ~$50/month (87% reduction from $377 warm standby). RTO: 3-4 hours, RPO: 1-4 hours",
+                "Cost and performance summary",
+            ),
         )
 
-        # Recovery instructions
-        CfnOutput(
-            self,
-            "RecoveryInstructions",
-            value=f"1. Restore from backup vault: {self._backup_plan.primary_backup_vault.backup_vault_name} 2. Deploy templates from: {self._template_storage.bucket_name} 3. Use deployment function: {self._deployment_automation.stack_deployment_function.function_name}",
-            description="Simple recovery instructions",
-            export_name=f"{self.stack_name}-RecoveryInstructions",
-        )
-
-        # Cost summary
-        CfnOutput(
-            self,
-            "CostSummary",
-            value="Backup & Restore pattern: ~$50/month (87% reduction from $377 warm standby). RTO: 3-4 hours, RPO: 1-4 hours",
-            description="Cost and performance summary",
-            export_name=f"{self.stack_name}-CostSummary",
-        )
+        add_outputs(self, outputs, _EXPORTED_OUTPUTS)
 
     def _add_tags(self) -> None:
         """Add tags to all resources in this stack."""
 
-        Tags.of(self).add("Component", "Backup")
-        Tags.of(self).add("Pattern", "BackupAndRestore")
-        Tags.of(self).add("CostOptimized", "True")
+        add_tags(
+            self,
+            {
+                "Component": "Backup",
+                "Pattern": "BackupAndRestore",
+                "CostOptimized": "True",
+            },
+        )
 
     @property
     def backup_plan(self) -> BackupPlan:
@@ -0,0 +1,69 @@
+"""
+Common Stack Helpers
+Small helpers shared by the DR lab stacks.
+"""
+
+from typing import AbstractSet, Dict, Iterable, Optional, Tuple
+
+import jsii
+from aws_cdk import Aspects, CfnOutput, IAspect, Stack, TagManager
+from aws_cdk import aws_sns as sns
+from aws_cdk import aws_sns_subscriptions as subs
+
+from constructs import IConstruct
+
+# Same priority Tags.of(...).add() uses by default
+_TAG_PRIORITY = 100
+
+
+@jsii.implements(IAspect)
+class _BulkTagAspect:
+    """Aspect that applies several tags in a single construct tree visit."""
+
+    def __init__(self, tags: Dict[str, str]) -> None:
+        self._tags = dict(tags)
+
+    def visit(self, node: IConstruct) -> None:
+        if TagManager.is_taggable(node):
+            tag_manager = node.tags
+        elif TagManager.is_taggable_v2(node):
+            tag_manager = node.cdk_tag_manager
+        else:
+            return
+
+        for key, value in self._tags.items():
+            tag_manager.set_tag(key, value, _TAG_PRIORITY)
+
+
+def add_email_subscription(topic: sns.ITopic, email: Optional[str]) -> None:
+    """Subscribe an email address to a topic if one is configured."""
+    if email:
+        topic.add_subscription(subs.EmailSubscription(email))
+
+
+def add_outputs(
+    stack: Stack,
+    outputs: Iterable[Tuple[str, str, str]],
+    exported: Optional[AbstractSet[str]] = None,
+) -> None:
+    """
+    Create (id, value, description) outputs on a stack.
+
+    Outputs whose id is in ``exported`` are exported as ``<stack name>-<id>``;
+    every output is exported when ``exported`` is None.
+    """
+    prefix = stack.stack_name + "-"
+    for output_id, value, description in outputs:
+        is_exported = exported is None or output_id in exported
+        CfnOutput(
+            stack,
+            output_id,
+            value=value,
+            description=description,
+            export_name=prefix + output_id if is_exported else None,
+        )
+
+
+def add_tags(scope: IConstruct, tags: Dict[str, str]) -> None:
+    """Apply several tags to every taggable resource under a scope."""
+    Aspects.of(scope).add(_BulkTagAspect(tags))
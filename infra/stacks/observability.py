@@ -3,25 +3,45 @@ Observability Stack
 Implements monitoring and observability for the DR environment.
 """
 
-from typing import Dict, List
-
-from aws_cdk import (
-    CfnOutput,
-    Duration,
-    Stack,
-    Tags,
-)
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, List
+
+from aws_cdk import Duration, Stack
 from aws_cdk import aws_cloudwatch as cloudwatch
 from aws_cdk import aws_cloudwatch_actions as cloudwatch_actions
-from aws_cdk import aws_ecs as ecs
-from aws_cdk import aws_elasticloadbalancingv2 as elbv2
-from aws_cdk import aws_logs as logs
-from aws_cdk import aws_rds as rds
-from aws_cdk import aws_s3 as s3
+from aws_cdk import aws_kms as kms
 from aws_cdk import aws_sns as sns
-from aws_cdk import aws_sns_subscriptions as subs
 
+from config import DRConfig
 from constructs import Construct
+from stacks.common import add_email_subscription, add_outputs, add_tags
+
+if TYPE_CHECKING:
+    from aws_cdk import aws_ecs as ecs
+    from aws_cdk import aws_elasticloadbalancingv2 as elbv2
+    from aws_cdk import aws_rds as rds
+    from aws_cdk import aws_s3 as s3
+
+# Metric periods shared by all widgets and alarms
+_ONE_MINUTE = Duration.minutes(1)
+_FIVE_MINUTES = Duration.minutes(5)
+_ONE_HOUR = Duration.hours(1)
+
+
+@dataclass(frozen=True)
+class AlarmSpec:
+    """Definition of a custom alarm for ObservabilityStack.add_custom_alarms."""
+
+    alarm_id: str
+    metric: cloudwatch.Metric
+    threshold: float
+    evaluation_periods: int = 2
+    comparison_operator: cloudwatch.ComparisonOperator = (
+        cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD
+    )
+    alarm_description: str = ""
+    alarm_name: str = ""
 
 
 # This ObservabilityStack class extends until the end of the file. It contains:
@@ -37,6 +57,7 @@ from constructs import Construct
 #   - dashboard property - Returns CloudWatch dashboard
 #   - notification_topic property - Returns SNS topic
 #   - add_custom_alarm() - Adds custom CloudWatch alarm
+#   - add_custom_alarms() - Adds a batch of custom CloudWatch alarms
 class ObservabilityStack(Stack):
     """
     Stack that implements monitoring and observability for the DR environment.
@@ -45,7 +66,6 @@ class ObservabilityStack(Stack):
     - CloudWatch dashboard with key metrics
     - Alarms for critical metrics
     - SNS topics for notifications
-    - Log groups and retention policies
     """
 
     def __init__(
@@ -53,14 +73,14 @@ class ObservabilityStack(Stack):
         scope: Construct,
         construct_id: str,
         *,
-        primary_alb: elbv2.ApplicationLoadBalancer,
-        secondary_alb: elbv2.ApplicationLoadBalancer,
-        primary_database: rds.DatabaseInstance,
-        secondary_database: rds.DatabaseInstance,
-        primary_ecs_service: ecs.FargateService,
-        secondary_ecs_service: ecs.FargateService,
-        s3_buckets: List[s3.Bucket],
-        config: Dict,
+        primary_alb: "elbv2.ApplicationLoadBalancer",
+        secondary_alb: "elbv2.ApplicationLoadBalancer",
+        primary_database: "rds.DatabaseInstance",
+        secondary_database: "rds.DatabaseInstance",
+        primary_ecs_service: "ecs.FargateService",
+        secondary_ecs_service: "ecs.FargateService",
+        s3_buckets: List["s3.Bucket"],
+        config: DRConfig,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -101,11 +121,10 @@ class ObservabilityStack(Stack):
         )
 
         # Add email subscription if configured
-        alarm_email = self._config.get("alarm_email")
-        if alarm_email:
-            self._notification_topic.add_subscription(
-                subs.EmailSubscription(alarm_email)
-            )
+        add_email_subscription(self._notification_topic, self._config.alarm_email)
+
+        # Single alarm action shared by every alarm in this stack
+        self._sns_action = cloudwatch_actions.SnsAction(self._notification_topic)
 
     def _create_dashboard(self) -> None:
         """Create CloudWatch dashboard with key metrics."""
@@ -114,19 +133,7 @@ class ObservabilityStack(Stack):
             self,
             "DRDashboard",
             dashboard_name="DR-Lab-Dashboard",
-            # Add default widget layout
-            widget_layout=cloudwatch.DashboardWidgetLayout(width=24, height=6),
         )
-        # Add log group for dashboard logs
-        log_group = logs.LogGroup(
-            self,
-            "DashboardLogGroup",
-            log_group_name="/aws/cloudwatch/dashboard",
-            retention=logs.RetentionDays.ONE_MONTH,
-        )
-
-        # Add log group to dashboard
-        self._dashboard.add_log_group(log_group)
 
         # Create widgets for the dashboard
         self._create_widgets()
@@ -134,6 +141,26 @@ class ObservabilityStack(Stack):
     def _create_widgets(self) -> None:
         """Create CloudWatch widgets for the dashboard."""
 
+        # Build each dimension map once and share it between widgets
+        primary_alb_dims = {"LoadBalancer": self._primary_alb.load_balancer_full_name}
+        secondary_alb_dims = {
+            "LoadBalancer": self._secondary_alb.load_balancer_full_name
+        }
+        primary_ecs_dims = {
+            "ClusterName": self._primary_ecs_service.cluster.cluster_name,
+            "ServiceName": self._primary_ecs_service.service_name,
+        }
+        secondary_ecs_dims = {
+            "ClusterName": self._secondary_ecs_service.cluster.cluster_name,
+            "ServiceName": self._secondary_ecs_service.service_name,
+        }
+        primary_rds_dims = {
+            "DBInstanceIdentifier": self._primary_database.primary_instance.instance_identifier
+        }
+        secondary_rds_dims = {
+            "DBInstanceIdentifier": self._secondary_database.instance_identifier
+        }
+
         # Create widgets for ALB, ECS, RDS, and S3 metrics
 
         # ALB Metrics - Primary Region
@@ -143,11 +170,9 @@ class ObservabilityStack(Stack):
                 cloudwatch.Metric(
                     namespace="AWS/ApplicationELB",
                     metric_name="HTTPCode_ELB_5XX_Count",
-                    dimensions_map={
-                        "LoadBalancer": self._primary_alb.load_balancer_full_name
-                    },
+                    dimensions_map=primary_alb_dims,
                     statistic="Sum",
-                    period=Duration.minutes(1),
+                    period=_ONE_MINUTE,
                 )
             ],
             left_y_axis=cloudwatch.YAxisProps(min=0),
@@ -159,11 +184,9 @@ class ObservabilityStack(Stack):
                 cloudwatch.Metric(
                     namespace="AWS/ApplicationELB",
                     metric_name="TargetResponseTime",
-                    dimensions_map={
-                        "LoadBalancer": self._primary_alb.load_balancer_full_name
-                    },
+                    dimensions_map=primary_alb_dims,
                     statistic="p95",
-                    period=Duration.minutes(1),
+                    period=_ONE_MINUTE,
                 )
             ],
             left_y_axis=cloudwatch.YAxisProps(min=0),
@@ -176,11 +199,9 @@ class ObservabilityStack(Stack):
                 cloudwatch.Metric(
                     namespace="AWS/ApplicationELB",
                     metric_name="HTTPCode_ELB_5XX_Count",
-                    dimensions_map={
-                        "LoadBalancer": self._secondary_alb.load_balancer_full_name
-                    },
+                    dimensions_map=secondary_alb_dims,
                     statistic="Sum",
-                    period=Duration.minutes(1),
+                    period=_ONE_MINUTE,
                 )
             ],
             left_y_axis=cloudwatch.YAxisProps(min=0),
@@ -192,11 +213,9 @@ class ObservabilityStack(Stack):
                 cloudwatch.Metric(
                     namespace="AWS/ApplicationELB",
                     metric_name="TargetResponseTime",
-                    dimensions_map={
-                        "LoadBalancer": self._secondary_alb.load_balancer_full_name
-                    },
+                    dimensions_map=secondary_alb_dims,
                     statistic="p95",
-                    period=Duration.minutes(1),
+                    period=_ONE_MINUTE,
                 )
             ],
             left_y_axis=cloudwatch.YAxisProps(min=0),
@@ -209,12 +228,9 @@ class ObservabilityStack(Stack):
                 cloudwatch.Metric(
                     namespace="AWS/ECS",
                     metric_name="CPUUtilization",
-                    dimensions_map={
-                        "ClusterName": self._primary_ecs_service.cluster.cluster_name,
-                        "ServiceName": self._primary_ecs_service.service_name,
-                    },
+                    dimensions_map=primary_ecs_dims,
                     statistic="Average",
-                    period=Duration.minutes(1),
+                    period=_ONE_MINUTE,
                 )
             ],
             left_y_axis=cloudwatch.YAxisProps(min=0, max=100),
@@ -226,12 +242,9 @@ class ObservabilityStack(Stack):
                 cloudwatch.Metric(
                     namespace="AWS/ECS",
                     metric_name="MemoryUtilization",
-                    dimensions_map={
-                        "ClusterName": self._primary_ecs_service.cluster.cluster_name,
-                        "ServiceName": self._primary_ecs_service.service_name,
-                    },
+                    dimensions_map=primary_ecs_dims,
                     statistic="Average",
-                    period=Duration.minutes(1),
+                    period=_ONE_MINUTE,
                 )
             ],
             left_y_axis=cloudwatch.YAxisProps(min=0, max=100),
@@ -244,12 +257,9 @@ class ObservabilityStack(Stack):
                 cloudwatch.Metric(
                     namespace="AWS/ECS",
                     metric_name="CPUUtilization",
-                    dimensions_map={
-                        "ClusterName": self._secondary_ecs_service.cluster.cluster_name,
-                        "ServiceName": self._secondary_ecs_service.service_name,
-                    },
+                    dimensions_map=secondary_ecs_dims,
                     statistic="Average",
-                    period=Duration.minutes(1),
+                    period=_ONE_MINUTE,
                 )
             ],
             left_y_axis=cloudwatch.YAxisProps(min=0, max=100),
@@ -261,12 +271,9 @@ class ObservabilityStack(Stack):
                 cloudwatch.Metric(
                     namespace="AWS/ECS",
                     metric_name="MemoryUtilization",
-                    dimensions_map={
-                        "ClusterName": self._secondary_ecs_service.cluster.cluster_name,
-                        "ServiceName": self._secondary_ecs_service.service_name,
-                    },
+                    dimensions_map=secondary_ecs_dims,
                     statistic="Average",
-                    period=Duration.minutes(1),
+                    period=_ONE_MINUTE,
                 )
             ],
             left_y_axis=cloudwatch.YAxisProps(min=0, max=100),
@@ -279,11 +286,9 @@ class ObservabilityStack(Stack):
                 cloudwatch.Metric(
                     namespace="AWS/RDS",
                     metric_name="CPUUtilization",
-                    dimensions_map={
-                        "DBInstanceIdentifier": self._primary_database.primary_instance.instance_identifier
-                    },
+                    dimensions_map=primary_rds_dims,
                     statistic="Average",
-                    period=Duration.minutes(1),
+                    period=_ONE_MINUTE,
                 )
             ],
             left_y_axis=cloudwatch.YAxisProps(min=0, max=100),
@@ -295,11 +300,9 @@ class ObservabilityStack(Stack):
                 cloudwatch.Metric(
                     namespace="AWS/RDS",
                     metric_name="DatabaseConnections",
-                    dimensions_map={
-                        "DBInstanceIdentifier": self._primary_database.primary_instance.instance_identifier
-                    },
+                    dimensions_map=primary_rds_dims,
                     statistic="Average",
-                    period=Duration.minutes(1),
+                    period=_ONE_MINUTE,
                 )
             ],
             left_y_axis=cloudwatch.YAxisProps(min=0),
@@ -312,11 +315,9 @@ class ObservabilityStack(Stack):
                 cloudwatch.Metric(
                     namespace="AWS/RDS",
                     metric_name="CPUUtilization",
-                    dimensions_map={
-                        "DBInstanceIdentifier": self._secondary_database.instance_identifier
-                    },
+                    dimensions_map=secondary_rds_dims,
                     statistic="Average",
-                    period=Duration.minutes(1),
+                    period=_ONE_MINUTE,
                 )
             ],
             left_y_axis=cloudwatch.YAxisProps(min=0, max=100),
@@ -328,22 +329,18 @@ class ObservabilityStack(Stack):
                 cloudwatch.Metric(
                     namespace="AWS/RDS",
                     metric_name="DatabaseConnections",
-                    dimensions_map={
-                        "DBInstanceIdentifier": self._secondary_database.instance_identifier
-                    },
+                    dimensions_map=secondary_rds_dims,
                     statistic="Average",
-                    period=Duration.minutes(1),
+                    period=_ONE_MINUTE,
                 )
             ],
             left_y_axis=cloudwatch.YAxisProps(min=0),
         )
 
         # S3 Metrics
-        s3_metrics_widgets = []
-        for i, bucket in enumerate(
-            self._s3_buckets[:4]
-        ):  # Limit to 4 buckets for dashboard
-            s3_widget = cloudwatch.GraphWidget(
+        # Limit to 4 buckets for dashboard
+        s3_metrics_widgets = [
+            cloudwatch.GraphWidget(
                 title=f"S3 Bucket {bucket.bucket_name} Metrics",
                 left=[
                     cloudwatch.Metric(
@@ -354,15 +351,16 @@ class ObservabilityStack(Stack):
                             "StorageType": "StandardStorage",
                         },
                         statistic="Average",
-                        period=Duration.hours(1),
+                        period=_ONE_HOUR,
                     )
                 ],
                 left_y_axis=cloudwatch.YAxisProps(min=0),
             )
-            s3_metrics_widgets.append(s3_widget)
+            for bucket in islice(self._s3_buckets, 4)
+        ]
 
-        # Add widgets to dashboard
-        self._dashboard.add_widgets(
+        # Add widgets to dashboard in a single call
+        rows = [
             cloudwatch.Row(
                 primary_alb_5xx_widget,
                 primary_alb_latency_widget,
@@ -381,167 +379,170 @@ class ObservabilityStack(Stack):
                 secondary_rds_cpu_widget,
                 secondary_rds_connections_widget,
             ),
-        )
+        ]
 
         # Add S3 widgets if there are any
         if s3_metrics_widgets:
-            s3_row = cloudwatch.Row(*s3_metrics_widgets)
-            self._dashboard.add_widgets(s3_row)
+            rows.append(cloudwatch.Row(*s3_metrics_widgets))
+
+        self._dashboard.add_widgets(*rows)
 
     def _create_alarms(self) -> None:
         """Create CloudWatch alarms for critical metrics."""
 
-        # ALB 5xx Error Rate Alarm - Primary
-        primary_alb_5xx_alarm = cloudwatch.Alarm(
-            self,
-            "PrimaryALB5xxAlarm",
-            metric=cloudwatch.Metric(
-                namespace="AWS/ApplicationELB",
-                metric_name="HTTPCode_ELB_5XX_Count",
-                dimensions_map={
-                    "LoadBalancer": self._primary_alb.load_balancer_full_name
-                },
-                statistic="Sum",
-                period=Duration.minutes(5),
-            ),
-            threshold=10,
-            evaluation_periods=2,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            alarm_description="Primary ALB 5xx error rate is too high",
-            alarm_name="dr-lab-primary-alb-5xx-errors",
-        )
-
-        # Add action to alarm
-        primary_alb_5xx_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self._notification_topic)
-        )
-
-        # ALB Latency Alarm - Primary
-        primary_alb_latency_alarm = cloudwatch.Alarm(
-            self,
-            "PrimaryALBLatencyAlarm",
-            metric=cloudwatch.Metric(
-                namespace="AWS/ApplicationELB",
-                metric_name="TargetResponseTime",
-                dimensions_map={
-                    "LoadBalancer": self._primary_alb.load_balancer_full_name
-                },
-                statistic="p95",
-                period=Duration.minutes(5),
+        # Build each dimension map once and share it between alarms
+        primary_alb_dims = {"LoadBalancer": self._primary_alb.load_balancer_full_name}
+        primary_ecs_dims = {
+            "ClusterName": self._primary_ecs_service.cluster.cluster_name,
+            "ServiceName": self._primary_ecs_service.service_name,
+        }
+        primary_rds_dims = {
+            "DBInstanceIdentifier": self._primary_database.primary_instance.instance_identifier
+        }
+
+        # (construct id, metric, threshold, evaluation periods, operator,
+        #  alarm name, description)
+        # Construct ids feed the alarms' logical ids; renaming one replaces
+        # the deployed alarm.
+        alarm_specs = [
+            # ALB 5xx Error Rate Alarm - Primary
+            (
+                "PrimaryALB5xxAlarm",
+                cloudwatch.Metric(
+                    namespace="AWS/ApplicationELB",
+                    metric_name="HTTPCode_ELB_5XX_Count",
+                    dimensions_map=primary_alb_dims,
+                    statistic="Sum",
+                    period=_FIVE_MINUTES,
+                ),
+                10,
+                2,
+                cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
+                "dr-lab-primary-alb-5xx-errors",
+                "Primary ALB 5xx error rate is too high",
             ),
-            threshold=2.0,  # 2 seconds
-            evaluation_periods=2,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            alarm_description="Primary ALB latency is too high",
-            alarm_name="dr-lab-primary-alb-latency",
-        )
-
-        # Add action to alarm
-        primary_alb_latency_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self._notification_topic)
-        )
-
-        # ECS Task Count Mismatch - Primary
-        primary_ecs_task_alarm = cloudwatch.Alarm(
-            self,
-            "PrimaryECSTaskCountAlarm",
-            metric=cloudwatch.Metric(
-                namespace="AWS/ECS",
-                metric_name="RunningTaskCount",
-                dimensions_map={
-                    "ClusterName": self._primary_ecs_service.cluster.cluster_name,
-                    "ServiceName": self._primary_ecs_service.service_name,
-                },
-                statistic="Average",
-                period=Duration.minutes(5),
+            # ALB Latency Alarm - Primary
+            (
+                "PrimaryALBLatencyAlarm",
+                cloudwatch.Metric(
+                    namespace="AWS/ApplicationELB",
+                    metric_name="TargetResponseTime",
+                    dimensions_map=primary_alb_dims,
+                    statistic="p95",
+                    period=_FIVE_MINUTES,
+                ),
+                2.0,  # 2 seconds
+                2,
+                cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
+                "dr-lab-primary-alb-latency",
+                "Primary ALB latency is too high",
             ),
-            threshold=1,  # Less than 1 task running
-            evaluation_periods=2,
-            comparison_operator=cloudwatch.ComparisonOperator.LESS_THAN_THRESHOLD,
-            alarm_description="Primary ECS service has insufficient running tasks",
-            alarm_name="dr-lab-primary-ecs-task-count",
-        )
-
-        # Add action to alarm
-        primary_ecs_task_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self._notification_topic)
-        )
-
-        # RDS CPU Utilization - Primary
-        primary_rds_cpu_alarm = cloudwatch.Alarm(
-            self,
-            "PrimaryRDSCPUAlarm",
-            metric=cloudwatch.Metric(
-                namespace="AWS/RDS",
-                metric_name="CPUUtilization",
-                dimensions_map={
-                    "DBInstanceIdentifier": self._primary_database.primary_instance.instance_identifier
-                },
-                statistic="Average",
-                period=Duration.minutes(5),
+            # ECS Task Count Mismatch - Primary
+            (
+                "PrimaryECSTaskCountAlarm",
+                cloudwatch.Metric(
+                    namespace="AWS/ECS",
+                    metric_name="RunningTaskCount",
+                    dimensions_map=primary_ecs_dims,
+                    statistic="Average",
+                    period=_FIVE_MINUTES,
+                ),
+                1,  # Less than 1 task running
+                2,
+                cloudwatch.ComparisonOperator.LESS_THAN_THRESHOLD,
+                "dr-lab-primary-ecs-task-count",
+                "Primary ECS service has insufficient running tasks",
             ),
-            threshold=80,
-            evaluation_periods=2,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            alarm_description="Primary RDS CPU utilization is too high",
-            alarm_name="dr-lab-primary-rds-cpu",
-        )
-
-        # Add action to alarm
-        primary_rds_cpu_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self._notification_topic)
-        )
-
-        # Health Check Failure Alarm
-        health_check_alarm = cloudwatch.Alarm(
-            self,
-            "PrimaryHealthCheckFailureAlarm",
-            metric=cloudwatch.Metric(
-                namespace="AWS/Route53",
-                metric_name="HealthCheckStatus",
-                dimensions_map={
-                    "HealthCheckId": "PRIMARY_HEALTH_CHECK_ID_PLACEHOLDER"  # This would be dynamically set
-                },
-                statistic="Minimum",
-                period=Duration.minutes(5),
+            # RDS CPU Utilization - Primary
+            (
+                "PrimaryRDSCPUAlarm",
+                cloudwatch.Metric(
+                    namespace="AWS/RDS",
+                    metric_name="CPUUtilization",
+                    dimensions_map=primary_rds_dims,
+                    statistic="Average",
+                    period=_FIVE_MINUTES,
+                ),
+                80,
+                2,
+                cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
+                "dr-lab-primary-rds-cpu",
+                "Primary RDS CPU utilization is too high",
             ),
-            threshold=1,
-            evaluation_periods=3,
-            comparison_operator=cloudwatch.ComparisonOperator.LESS_THAN_THRESHOLD,
-            alarm_description="Primary health check is failing",
-            alarm_name="dr-lab-primary-health-check-failure",
-        )
+        ]
+
+        # Health Check Failure Alarm, only when the health check is known;
+        # without a real id the alarm could never leave INSUFFICIENT_DATA
+        health_check_id = self._config.primary_health_check_id
+        if health_check_id:
+            alarm_specs.append(
+                (
+                    "PrimaryHealthCheckFailureAlarm",
+                    cloudwatch.Metric(
+                        namespace="AWS/Route53",
+                        metric_name="HealthCheckStatus",
+                        dimensions_map={"HealthCheckId": health_check_id},
+                        statistic="Minimum",
+                        period=_ONE_MINUTE,
+                    ),
+                    1,
+                    self._config.health_check_failure_threshold,
+                    cloudwatch.ComparisonOperator.LESS_THAN_THRESHOLD,
+                    "dr-lab-primary-health-check-failure",
+                    "Primary health check is failing",
+                )
+            )
 
-        # Add action to alarm
-        health_check_alarm.add_alarm_action(
-            cloudwatch_actions.SnsAction(self._notification_topic)
-        )
+        for (
+            alarm_id,
+            metric,
+            threshold,
+            evaluation_periods,
+            comparison_operator,
+            alarm_name,
+            alarm_description,
+        ) in alarm_specs:
+            alarm = cloudwatch.Alarm(
+                self,
+                alarm_id,
+                metric=metric,
+                threshold=threshold,
+                evaluation_periods=evaluation_periods,
+                comparison_operator=comparison_operator,
+                alarm_description=alarm_description,
+                alarm_name=alarm_name,
+            )
+            alarm.add_alarm_action(self._sns_action)
 
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
-        CfnOutput(
-            self,
-            "DashboardName",
-            value=self._dashboard.dashboard_name,
-            description="Name of the CloudWatch dashboard",
-            export_name=f"{self.stack_name}-DashboardName",
+        outputs = (
+            (
+                "DashboardName",
+                self._dashboard.dashboard_name,
+                "Name of the CloudWatch dashboard",
+            ),
+            (
+                "NotificationTopicArn",
+                self._notification_topic.topic_arn,
+                "ARN of the monitoring notification topic",
+            ),
         )
 
-        CfnOutput(
-            self,
-            "NotificationTopicArn",
-            value=self._notification_topic.topic_arn,
-            description="ARN of the monitoring notification topic",
-            export_name=f"{self.stack_name}-NotificationTopicArn",
-        )
+        add_outputs(self, outputs)
 
     def _add_tags(self) -> None:
         """Add tags to all resources in this stack."""
 
-        Tags.of(self).add("Component", "Observability")
-        Tags.of(self).add("Environment", self._config.get("environment", "Production"))
-        Tags.of(self).add("Project", self._config.get("project_name", "DR Lab"))
+        add_tags(
+            self,
+            {
+                "Component": "Observability",
+                "Environment": self._config.environment,
+                "Project": self._config.project_name,
+            },
+        )
 
     @property
     def dashboard(self) -> cloudwatch.Dashboard:
@@ -565,33 +566,52 @@ class ObservabilityStack(Stack):
     ) -> cloudwatch.Alarm:
         """Add a custom alarm to the monitoring system."""
 
+        return self.add_custom_alarms(
+            [
+                AlarmSpec(
+                    alarm_id=alarm_id,
+                    metric=metric,
+                    threshold=threshold,
+                    evaluation_periods=evaluation_periods,
+                    comparison_operator=comparison_operator,
+                    alarm_description=alarm_description,
+                    alarm_name=alarm_name,
+                )
+            ]
+        )[0]
+
+    def add_custom_alarms(self, specs: List[AlarmSpec]) -> List[cloudwatch.Alarm]:
+        """Add a batch of custom alarms sharing the stack's SNS action."""
+
         # Validate inputs
-        if not alarm_id or not alarm_id.strip():
-            raise ValueError("alarm_id cannot be empty")
-        if not metric:
-            raise ValueError("metric is required")
-        if evaluation_periods < 1:
-            raise ValueError("evaluation_periods must be at least 1")
+        for spec in specs:
+            if not spec.alarm_id or not spec.alarm_id.strip():
+                raise ValueError("alarm_id cannot be empty")
+            if not spec.metric:
+                raise ValueError("metric is required")
+            if spec.evaluation_periods < 1:
+                raise ValueError("evaluation_periods must be at least 1")
         if not hasattr(self, "_notification_topic") or not self._notification_topic:
             raise RuntimeError("notification_topic not initialized")
 
-        try:
-            alarm = cloudwatch.Alarm(
-                self,
-                alarm_id,
-                metric=metric,
-                threshold=threshold,
-                evaluation_periods=evaluation_periods,
-                comparison_operator=comparison_operator,
-                alarm_description=alarm_description,
-                alarm_name=alarm_name or f"dr-lab-{alarm_id.lower()}",
-            )
+        alarms = []
+        for spec in specs:
+            try:
+                alarm = cloudwatch.Alarm(
+                    self,
+                    spec.alarm_id,
+                    metric=spec.metric,
+                    threshold=spec.threshold,
+                    evaluation_periods=spec.evaluation_periods,
+                    comparison_operator=spec.comparison_operator,
+                    alarm_description=spec.alarm_description,
+                    alarm_name=spec.alarm_name or f"dr-lab-{spec.alarm_id.lower()}",
+                )
 
-            # Add action to alarm
-            alarm.add_alarm_action(
-                cloudwatch_actions.SnsAction(self._notification_topic)
-            )
+                # Add action to alarm
+                alarm.add_alarm_action(self._sns_action)
+            except Exception as e:
+                raise RuntimeError(f"Failed to create alarm {spec.alarm_id}: {str(e)}")
+            alarms.append(alarm)
 
-            return alarm
-        except Exception as e:
-            raise RuntimeError(f"Failed to create alarm {alarm_id}: {str(e)}")
+        return alarms
@@ -3,23 +3,43 @@ Primary App Stack
 Creates the application infrastructure in the primary region.
 """
 
-from typing import Dict
-
-from aws_cdk import (
-    CfnOutput,
-    Duration,
-    Stack,
-    Tags,
-)
-from aws_cdk import aws_ec2 as ec2
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict
+
+from aws_cdk import Stack
 from aws_cdk import aws_ecs as ecs
 from aws_cdk import aws_logs as logs
-from aws_cdk import aws_s3 as s3
-from aws_cdk import aws_secretsmanager as secretsmanager
 
+from config import DRConfig
 from constructs import Construct
 from constructs.ecs_service_alb import ECSServiceALB
 from constructs.rds_with_replica import RDSWithReplica
+from stacks.common import add_outputs, add_tags
+
+if TYPE_CHECKING:
+    from aws_cdk import aws_ec2 as ec2
+    from aws_cdk import aws_elasticloadbalancingv2 as elbv2
+    from aws_cdk import aws_s3 as s3
+
+# Outputs other stacks or accounts consume; the rest are for humans only
+_EXPORTED_OUTPUTS = frozenset({"LoadBalancerDNS", "LoadBalancerHostedZoneId"})
+
+
+@lru_cache(maxsize=None)
+def _container_image(image: str) -> ecs.ContainerImage:
+    """Resolve a registry image reference once per app."""
+    return ecs.ContainerImage.from_registry(image)
+
+
+def _container_environment(region: str, bucket_name: str) -> Dict[str, str]:
+    """Build the container environment for a region and bucket."""
+    return {
+        "AWS_DEFAULT_REGION": region,
+        "ENVIRONMENT": "production",
+        "REGION": "primary",
+        "S3_BUCKET": bucket_name,
+        "DATABASE_NAME": "drlab",
+    }
 
 
 class PrimaryAppStack(Stack):
@@ -39,10 +59,10 @@ class PrimaryAppStack(Stack):
         scope: Construct,
         construct_id: str,
         *,
-        vpc: ec2.Vpc,
+        vpc: "ec2.Vpc",
         database: RDSWithReplica,
-        s3_bucket: s3.Bucket,
-        config: Dict,
+        s3_bucket: "s3.Bucket",
+        config: DRConfig,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -51,6 +71,7 @@ class PrimaryAppStack(Stack):
         self._database = database
         self._s3_bucket = s3_bucket
         self._config = config
+        self._region = self.region
 
         # Create ECS cluster
         self._create_ecs_cluster()
@@ -71,7 +92,7 @@ class PrimaryAppStack(Stack):
             self,
             "Cluster",
             vpc=self._vpc,
-            cluster_name=f"dr-lab-primary-{self.region}",
+            cluster_name=f"dr-lab-primary-{self._region}",
             enable_fargate_capacity_providers=True,
             container_insights_v2=ecs.ContainerInsights.ENABLED,
         )
@@ -83,24 +104,23 @@ class PrimaryAppStack(Stack):
         """Create the ECS service with Application Load Balancer."""
 
         # Prepare environment variables
-        environment_variables = {
-            "AWS_DEFAULT_REGION": self.region,
-            "ENVIRONMENT": "production",
-            "REGION": "primary",
-            "S3_BUCKET": self._s3_bucket.bucket_name,
-            "DATABASE_NAME": "drlab",
-        }
+        environment_variables = _container_environment(
+            self._region, self._s3_bucket.bucket_name
+        )
 
         # Prepare secrets - simplified to avoid circular dependency
-        # In production, these would be properly configured
+        # In production, inject the database secret as a single JSON reference,
+        # e.g. {"DATABASE_SECRET": ecs.Secret.from_secrets_manager(secret)},
+        # and let the container parse host/port/username/password from it
+        # rather than adding one secret reference per field
         secrets = {}
 
         # Get configuration
-        container_image = self._config.get("container_image", "nginx:latest")
-        container_port = self._config.get("container_port", 80)
-        health_check_path = self._config.get("health_check_path", "/healthz")
-        ecs_cpu = self._config.get("ecs_cpu", 256)
-        ecs_memory = self._config.get("ecs_memory", 512)
+        container_image = _container_image(self._config.container_image)
+        container_port = self._config.container_port
+        health_check_path = self._config.health_check_path
+        ecs_cpu = self._config.ecs_cpu
+        ecs_memory = self._config.ecs_memory
         task_count = 2  # Primary region always runs 2 tasks
 
         # Create ECS service with ALB
@@ -121,140 +141,81 @@ class PrimaryAppStack(Stack):
             secrets=secrets,
             enable_logging=True,
             log_retention=logs.RetentionDays.TWO_WEEKS,
+            target_group_attributes={
+                "stickiness.enabled": "false",
+                "load_balancing.algorithm.type": "round_robin",
+            },
         )
 
-        # Grant permissions to access S3 bucket
+        # Grant permissions to access S3 bucket. The grant also covers the
+        # bucket's KMS key, which a hand-written S3 statement would miss.
         self._s3_bucket.grant_read_write(self._ecs_service_alb.task_role)
 
         # Database connections will be configured during deployment
         # This avoids circular dependency issues during CDK synthesis
 
-        # Create custom target group for health checks
-        self._create_health_check_configuration()
-
-    def _create_health_check_configuration(self) -> None:
-        """Configure advanced health check settings."""
-
-        # Get the target group from the ECS service
-        target_group = self._ecs_service_alb.target_group
-
-        # Configure health check settings
-        cfn_target_group = target_group.node.default_child
-        cfn_target_group.health_check_enabled = True
-        cfn_target_group.health_check_grace_period_seconds = 60
-        cfn_target_group.health_check_interval_seconds = 30
-        cfn_target_group.health_check_path = self._config.get(
-            "health_check_path", "/healthz"
-        )
-        cfn_target_group.health_check_port = "traffic-port"
-        cfn_target_group.health_check_protocol = "HTTP"
-        cfn_target_group.health_check_timeout_seconds = 5
-        cfn_target_group.healthy_threshold_count = 2
-        cfn_target_group.unhealthy_threshold_count = 3
-        cfn_target_group.matcher = {"HttpCode": "200"}
-
-        # Configure deregistration delay
-        cfn_target_group.target_group_attributes = [
-            {"Key": "deregistration_delay.timeout_seconds", "Value": "30"},
-            {"Key": "stickiness.enabled", "Value": "false"},
-            {"Key": "load_balancing.algorithm.type", "Value": "round_robin"},
-        ]
-
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
-        # ECS Cluster outputs
-        CfnOutput(
-            self,
-            "ClusterName",
-            value=self._cluster.cluster_name,
-            description="Name of the ECS cluster",
-            export_name=f"{self.stack_name}-ClusterName",
-        )
-
-        CfnOutput(
-            self,
-            "ClusterArn",
-            value=self._cluster.cluster_arn,
-            description="ARN of the ECS cluster",
-            export_name=f"{self.stack_name}-ClusterArn",
-        )
-
-        # Load Balancer outputs
-        CfnOutput(
-            self,
-            "LoadBalancerDNS",
-            value=self._ecs_service_alb.load_balancer.load_balancer_dns_name,
-            description="DNS name of the Application Load Balancer",
-            export_name=f"{self.stack_name}-LoadBalancerDNS",
-        )
-
-        CfnOutput(
-            self,
-            "LoadBalancerArn",
-            value=self._ecs_service_alb.load_balancer.load_balancer_arn,
-            description="ARN of the Application Load Balancer",
-            export_name=f"{self.stack_name}-LoadBalancerArn",
+        if not self._config.emit_cfn_outputs:
+            return
+
+        load_balancer = self._ecs_service_alb.load_balancer
+        service = self._ecs_service_alb.service
+        dns_name = load_balancer.load_balancer_dns_name
+        app_url = f"http://{dns_name}"
+
+        outputs = (
+            # ECS Cluster outputs
+            ("ClusterName", self._cluster.cluster_name, "Name of the ECS cluster"),
+            ("ClusterArn", self._cluster.cluster_arn, "ARN of the ECS cluster"),
+            # Load Balancer outputs
+            (
+                "LoadBalancerDNS",
+                dns_name,
+                "DNS name of the Application Load Balancer",
+            ),
+            (
+                "LoadBalancerArn",
+                load_balancer.load_balancer_arn,
+                "ARN of the Application Load Balancer",
+            ),
+            (
+                "LoadBalancerHostedZoneId",
+                load_balancer.load_balancer_canonical_hosted_zone_id,
+                "Hosted Zone ID of the Application Load Balancer",
+            ),
+            # ECS Service outputs
+            ("ServiceName", service.service_name, "Name of the ECS service"),
+            ("ServiceArn", service.service_arn, "ARN of the ECS service"),
+            # Target Group outputs
+            (
+                "TargetGroupArn",
+                self._ecs_service_alb.target_group.target_group_arn,
+                "ARN of the target group",
+            ),
+            # Application URLs
+            ("ApplicationURL", app_url, "URL of the application"),
+            (
+                "HealthCheckURL",
+                app_url + self._config.health_check_path,
+                "Health check URL of the application",
+            ),
         )
 
-        CfnOutput(
-            self,
-            "LoadBalancerHostedZoneId",
-            value=self._ecs_service_alb.load_balancer.load_balancer_canonical_hosted_zone_id,
-            description="Hosted Zone ID of the Application Load Balancer",
-            export_name=f"{self.stack_name}-LoadBalancerHostedZoneId",
-        )
-
-        # ECS Service outputs
-        CfnOutput(
-            self,
-            "ServiceName",
-            value=self._ecs_service_alb.service.service_name,
-            description="Name of the ECS service",
-            export_name=f"{self.stack_name}-ServiceName",
-        )
-
-        CfnOutput(
-            self,
-            "ServiceArn",
-            value=self._ecs_service_alb.service.service_arn,
-            description="ARN of the ECS service",
-            export_name=f"{self.stack_name}-ServiceArn",
-        )
-
-        # Target Group outputs
-        CfnOutput(
-            self,
-            "TargetGroupArn",
-            value=self._ecs_service_alb.target_group.target_group_arn,
-            description="ARN of the target group",
-            export_name=f"{self.stack_name}-TargetGroupArn",
-        )
-
-        # Application URL
-        CfnOutput(
-            self,
-            "ApplicationURL",
-            value=f"http://{self._ecs_service_alb.load_balancer.load_balancer_dns_name}",
-            description="URL of the application",
-            export_name=f"{self.stack_name}-ApplicationURL",
-        )
-
-        # Health Check URL
-        CfnOutput(
-            self,
-            "HealthCheckURL",
-            value=f"http://{self._ecs_service_alb.load_balancer.load_balancer_dns_name}{self._config.get('health_check_path', '/healthz')}",
-            description="Health check URL of the application",
-            export_name=f"{self.stack_name}-HealthCheckURL",
-        )
+        add_outputs(self, outputs, _EXPORTED_OUTPUTS)
 
     def _add_tags(self) -> None:
         """Add tags to all resources in this stack."""
 
-        Tags.of(self).add("Component", "Application")
-        Tags.of(self).add("Region", "Primary")
-        Tags.of(self).add("Environment", "Production")
+        add_tags(
+            self,
+            {
+                "Component": "Application",
+                "Region": "Primary",
+                "Environment": "Production",
+            },
+        )
 
     @property
     def cluster(self) -> ecs.Cluster:
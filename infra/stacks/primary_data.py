@@ -3,24 +3,55 @@ Primary Data Stack
 Creates the data infrastructure in the primary region.
 """
 
-from typing import Dict
-
-from aws_cdk import (
-    CfnOutput,
-    Duration,
-    Stack,
-    Tags,
-)
+from functools import lru_cache
+
+from aws_cdk import Duration, Stack
 from aws_cdk import aws_ec2 as ec2
-from aws_cdk import aws_kms as kms
-from aws_cdk import aws_logs as logs
-from aws_cdk import aws_rds as rds
 from aws_cdk import aws_s3 as s3
 
+from config import DRConfig
 from constructs import Construct
 from constructs.kms_multi_region_key import KMSMultiRegionKey
 from constructs.rds_with_replica import RDSWithReplica
 from constructs.s3_replication_pair import S3ReplicationPair
+from stacks.common import add_outputs, add_tags
+
+# Outputs other stacks or accounts consume; the rest are for humans only
+_EXPORTED_OUTPUTS = frozenset({"KMSKeyArn", "DatabaseSecretArn", "AppDataBucketName"})
+
+# Key prefix for CloudWatch Logs exports in the shared logs bucket
+_CLOUDWATCH_LOGS_PREFIX = "cloudwatch/"
+
+# Enhanced monitoring interval for the database
+_SIXTY_SECONDS = Duration.seconds(60)
+
+# Instance classes the lab is sized for
+_DB_SIZE_MAP = {
+    "db.t3.micro": (ec2.InstanceClass.T3, ec2.InstanceSize.MICRO),
+    "db.t3.small": (ec2.InstanceClass.T3, ec2.InstanceSize.SMALL),
+    "db.t3.medium": (ec2.InstanceClass.T3, ec2.InstanceSize.MEDIUM),
+    "db.t3.large": (ec2.InstanceClass.T3, ec2.InstanceSize.LARGE),
+    "db.t3.xlarge": (ec2.InstanceClass.T3, ec2.InstanceSize.XLARGE),
+    # Enum member is XLARGE2, so the name-based fallback can't resolve this
+    "db.t3.2xlarge": (ec2.InstanceClass.T3, ec2.InstanceSize.XLARGE2),
+}
+
+
+@lru_cache(maxsize=None)
+def _db_instance_type(instance_class: str) -> ec2.InstanceType:
+    """Resolve a ``db.<class>.<size>`` string to an EC2 instance type."""
+    try:
+        ec2_class, ec2_size = _DB_SIZE_MAP[instance_class]
+    except KeyError:
+        ec2_class = ec2.InstanceClass.T3
+        ec2_size = ec2.InstanceSize(instance_class.rpartition(".")[2].upper())
+    return ec2.InstanceType.of(ec2_class, ec2_size)
+
+
+@lru_cache(maxsize=32)
+def _days(days: int) -> Duration:
+    """Return a shared Duration for a whole number of days."""
+    return Duration.days(days)
 
 
 class PrimaryDataStack(Stack):
@@ -40,7 +71,7 @@ class PrimaryDataStack(Stack):
         construct_id: str,
         *,
         vpc: ec2.Vpc,
-        config: Dict,
+        config: DRConfig,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -48,6 +79,8 @@ class PrimaryDataStack(Stack):
         self._vpc = vpc
         self._config = config
 
+        # The database and buckets are encrypted with the KMS keys, so keys come first
+
         # Create KMS keys
         self._create_kms_keys()
 
@@ -66,6 +99,11 @@ class PrimaryDataStack(Stack):
     def _create_kms_keys(self) -> None:
         """Create KMS keys for encryption."""
 
+        # Both keys replicate to the same region; share one immutable value.
+        # Without a secondary region (e.g. dev) the keys stay single-region.
+        secondary_region = self._config.secondary_region
+        replica_regions = (secondary_region,) if secondary_region else ()
+
         # Main encryption key for data
         self._kms_key = KMSMultiRegionKey(
             self,
@@ -73,7 +111,7 @@ class PrimaryDataStack(Stack):
             alias="dr-lab-data-key",
             description="Multi-region KMS key for DR lab data encryption",
             enable_key_rotation=True,
-            replica_regions=[self._config.get("secondary_region", "us-west-2")],
+            replica_regions=replica_regions,
         )
 
         # Separate key for logs
@@ -83,7 +121,7 @@ class PrimaryDataStack(Stack):
             alias="dr-lab-logs-key",
             description="Multi-region KMS key for DR lab logs encryption",
             enable_key_rotation=True,
-            replica_regions=[self._config.get("secondary_region", "us-west-2")],
+            replica_regions=replica_regions,
         )
 
     def _create_database(self) -> None:
@@ -91,24 +129,15 @@ class PrimaryDataStack(Stack):
 
         # Get database configuration
         db_config = {
-            "instance_class": ec2.InstanceType.of(
-                ec2.InstanceClass.T3,
-                ec2.InstanceSize(
-                    self._config.get("db_instance_class", "db.t3.micro")
-                    .split(".")[-1]
-                    .upper()
-                ),
-            ),
-            "allocated_storage": self._config.get("db_allocated_storage", 20),
-            "backup_retention": Duration.days(
-                self._config.get("db_backup_retention", 7)
-            ),
+            "instance_class": _db_instance_type(self._config.db_instance_class),
+            "allocated_storage": self._config.db_allocated_storage,
+            "backup_retention": _days(self._config.db_backup_retention),
             "database_name": "drlab",
             "username": "admin",
             "kms_key": self._kms_key.key,
-            "replica_region": self._config.get("secondary_region"),
+            "replica_region": self._config.secondary_region,
             "enable_performance_insights": True,
-            "monitoring_interval": Duration.seconds(60),
+            "monitoring_interval": _SIXTY_SECONDS,
             "enable_logging": True,
             "log_types": ["postgresql"],
         }
@@ -122,17 +151,20 @@ class PrimaryDataStack(Stack):
     def _create_s3_buckets(self) -> None:
         """Create S3 buckets for application data and logs."""
 
+        # Multi-region key, so the same key works in both regions
+        data_key = self._kms_key.key
+
         # Application data bucket with replication
         self._app_data_bucket_construct = S3ReplicationPair(
             self,
             "AppDataBucket",
-            source_region=self._config.get("primary_region", "ap-southeast-2"),
-            destination_region=self._config.get("secondary_region", "us-west-2"),
+            source_region=self._config.primary_region,
+            destination_region=self._config.secondary_region,
             bucket_name_prefix="dr-lab-app-data",
             versioned=True,
-            replicate_deletes=self._config.get("s3_replicate_deletes", False),
-            kms_key=self._kms_key.key,
-            destination_kms_key=self._kms_key.key,  # Multi-region key works in both regions
+            replicate_deletes=self._config.s3_replicate_deletes,
+            kms_key=data_key,
+            destination_kms_key=data_key,
             lifecycle_rules=[
                 s3.LifecycleRule(
                     id="TransitionToGlacier",
@@ -140,8 +172,8 @@ class PrimaryDataStack(Stack):
                     transitions=[
                         s3.Transition(
                             storage_class=s3.StorageClass.GLACIER,
-                            transition_after=Duration.days(
-                                self._config.get("s3_lifecycle_glacier_days", 90)
+                            transition_after=_days(
+                                self._config.s3_lifecycle_glacier_days
                             ),
                         )
                     ],
@@ -149,17 +181,20 @@ class PrimaryDataStack(Stack):
                 s3.LifecycleRule(
                     id="DeleteIncompleteMultipartUploads",
                     enabled=True,
-                    abort_incomplete_multipart_upload_after=Duration.days(7),
+                    abort_incomplete_multipart_upload_after=_days(7),
                 ),
             ],
             enable_access_logging=True,
         )
 
-        # Logs bucket (no replication needed for logs)
+        # Logs bucket (no replication needed for logs). CloudWatch Logs exports
+        # go under their own prefix and share the bucket-wide expiration: S3
+        # applies the shortest of overlapping expirations, so a longer
+        # prefix rule would never take effect.
         self._logs_bucket = s3.Bucket(
             self,
             "LogsBucket",
-            bucket_name=f"dr-lab-logs-{self._config.get('primary_region', 'ap-southeast-2')}",
+            bucket_name=f"dr-lab-logs-{self._config.primary_region}",
             versioned=False,
             encryption=s3.BucketEncryption.KMS,
             encryption_key=self._logs_kms_key.key,
@@ -167,9 +202,7 @@ class PrimaryDataStack(Stack):
                 s3.LifecycleRule(
                     id="DeleteOldLogs",
                     enabled=True,
-                    expiration=Duration.days(
-                        self._config.get("cloudwatch_log_retention_days", 14) * 2
-                    ),
+                    expiration=_days(self._config.cloudwatch_log_retention_days * 2),
                 ),
             ],
             public_read_access=False,
@@ -177,118 +210,73 @@ class PrimaryDataStack(Stack):
             enforce_ssl=True,
         )
 
-        # CloudWatch Logs destination bucket
-        self._cloudwatch_logs_bucket = s3.Bucket(
-            self,
-            "CloudWatchLogsBucket",
-            bucket_name=f"dr-lab-cloudwatch-logs-{self._config.get('primary_region', 'ap-southeast-2')}",
-            versioned=False,
-            encryption=s3.BucketEncryption.KMS,
-            encryption_key=self._logs_kms_key.key,
-            lifecycle_rules=[
-                s3.LifecycleRule(
-                    id="DeleteOldCloudWatchLogs",
-                    enabled=True,
-                    expiration=Duration.days(90),
-                )
-            ],
-            public_read_access=False,
-            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
-            enforce_ssl=True,
-        )
-
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
-        # KMS Key outputs
-        CfnOutput(
-            self,
-            "KMSKeyId",
-            value=self._kms_key.key_id,
-            description="ID of the main KMS key",
-            export_name=f"{self.stack_name}-KMSKeyId",
-        )
-
-        CfnOutput(
-            self,
-            "KMSKeyArn",
-            value=self._kms_key.key_arn,
-            description="ARN of the main KMS key",
-            export_name=f"{self.stack_name}-KMSKeyArn",
-        )
-
-        CfnOutput(
-            self,
-            "LogsKMSKeyId",
-            value=self._logs_kms_key.key_id,
-            description="ID of the logs KMS key",
-            export_name=f"{self.stack_name}-LogsKMSKeyId",
-        )
-
-        # Database outputs
-        CfnOutput(
-            self,
-            "DatabaseEndpoint",
-            value=self._database.primary_instance.instance_endpoint.hostname,
-            description="Primary database endpoint",
-            export_name=f"{self.stack_name}-DatabaseEndpoint",
-        )
-
-        CfnOutput(
-            self,
-            "DatabasePort",
-            value=str(self._database.primary_instance.instance_endpoint.port),
-            description="Primary database port",
-            export_name=f"{self.stack_name}-DatabasePort",
-        )
-
-        CfnOutput(
-            self,
-            "DatabaseSecretArn",
-            value=self._database.secret.secret_arn,
-            description="ARN of the database credentials secret",
-            export_name=f"{self.stack_name}-DatabaseSecretArn",
-        )
-
-        # S3 bucket outputs
-        CfnOutput(
-            self,
-            "AppDataBucketName",
-            value=self._app_data_bucket_construct.source_bucket.bucket_name,
-            description="Name of the application data bucket",
-            export_name=f"{self.stack_name}-AppDataBucketName",
-        )
-
-        CfnOutput(
-            self,
-            "AppDataBucketArn",
-            value=self._app_data_bucket_construct.source_bucket.bucket_arn,
-            description="ARN of the application data bucket",
-            export_name=f"{self.stack_name}-AppDataBucketArn",
-        )
-
-        CfnOutput(
-            self,
-            "LogsBucketName",
-            value=self._logs_bucket.bucket_name,
-            description="Name of the logs bucket",
-            export_name=f"{self.stack_name}-LogsBucketName",
+        if not self._config.emit_cfn_outputs:
+            return
+
+        db_instance = self._database.primary_instance
+        app_data_bucket = self._app_data_bucket_construct.source_bucket
+
+        outputs = (
+            # KMS Key outputs
+            ("KMSKeyId", self._kms_key.key_id, "ID of the main KMS key"),
+            ("KMSKeyArn", self._kms_key.key_arn, "ARN of the main KMS key"),
+            ("LogsKMSKeyId", self._logs_kms_key.key_id, "ID of the logs KMS key"),
+            # Database outputs
+            (
+                "DatabaseEndpoint",
+                db_instance.instance_endpoint.hostname,
+                "Primary database endpoint",
+            ),
+            (
+                "DatabasePort",
+                str(db_instance.instance_endpoint.port),
+                "Primary database port",
+            ),
+            (
+                "DatabaseSecretArn",
+                self._database.secret.secret_arn,
+                "ARN of the database credentials secret",
+            ),
+            # S3 bucket outputs
+            (
+                "AppDataBucketName",
+                app_data_bucket.bucket_name,
+                "Name of the application data bucket",
+            ),
+            (
+                "AppDataBucketArn",
+                app_data_bucket.bucket_arn,
+                "ARN of the application data bucket",
+            ),
+            (
+                "LogsBucketName",
+                self._logs_bucket.bucket_name,
+                "Name of the logs bucket",
+            ),
+            (
+                "CloudWatchLogsBucketName",
+                self._logs_bucket.bucket_name,
+                "Deprecated: same as LogsBucketName; use it with CloudWatchLogsPrefix",
+            ),
+            (
+                "CloudWatchLogsPrefix",
+                _CLOUDWATCH_LOGS_PREFIX,
+                "Key prefix for CloudWatch logs exports in the logs bucket",
+            ),
         )
 
-        CfnOutput(
-            self,
-            "CloudWatchLogsBucketName",
-            value=self._cloudwatch_logs_bucket.bucket_name,
-            description="Name of the CloudWatch logs bucket",
-            export_name=f"{self.stack_name}-CloudWatchLogsBucketName",
-        )
+        add_outputs(self, outputs, _EXPORTED_OUTPUTS)
 
     def _add_tags(self) -> None:
         """Add tags to all resources in this stack."""
 
-        Tags.of(self).add("Component", "Data")
-        Tags.of(self).add("Region", "Primary")
-        Tags.of(self).add("Environment", "Production")
+        add_tags(
+            self,
+            {"Component": "Data", "Region": "Primary", "Environment": "Production"},
+        )
 
     @property
     def kms_key(self) -> KMSMultiRegionKey:
@@ -315,11 +303,6 @@ class PrimaryDataStack(Stack):
         """Get the logs bucket."""
         return self._logs_bucket
 
-    @property
-    def cloudwatch_logs_bucket(self) -> s3.Bucket:
-        """Get the CloudWatch logs bucket."""
-        return self._cloudwatch_logs_bucket
-
     @property
     def app_data_bucket_construct(self) -> S3ReplicationPair:
         """Get the application data bucket construct."""
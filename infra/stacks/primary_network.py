@@ -3,12 +3,42 @@ Primary Network Stack
 Creates the foundational network infrastructure in the primary region.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List
 
-from aws_cdk import CfnOutput, Stack, Tags
+from aws_cdk import Stack
 from aws_cdk import aws_ec2 as ec2
 
+from config import DRConfig
 from constructs import Construct
+from stacks.common import add_outputs, add_tags
+
+# Subnet selections shared by the VPC endpoints
+_PRIVATE_SUBNETS = ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS)
+_ISOLATED_SUBNETS = ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED)
+
+# Gateway endpoints (free) for S3 and DynamoDB, keyed by config name
+_GATEWAY_ENDPOINTS = {
+    "s3": ("S3Endpoint", ec2.GatewayVpcEndpointAwsService.S3),
+    "dynamodb": ("DynamoDBEndpoint", ec2.GatewayVpcEndpointAwsService.DYNAMODB),
+}
+
+# Interface endpoints for ECR, CloudWatch Logs, Secrets Manager and KMS
+_INTERFACE_ENDPOINTS = {
+    "ecr": ("ECRAPIEndpoint", ec2.InterfaceVpcEndpointAwsService.ECR),
+    "ecr_docker": ("ECRDockerEndpoint", ec2.InterfaceVpcEndpointAwsService.ECR_DOCKER),
+    "logs": (
+        "CloudWatchLogsEndpoint",
+        ec2.InterfaceVpcEndpointAwsService.CLOUDWATCH_LOGS,
+    ),
+    "secretsmanager": (
+        "SecretsManagerEndpoint",
+        ec2.InterfaceVpcEndpointAwsService.SECRETS_MANAGER,
+    ),
+    "kms": ("KMSEndpoint", ec2.InterfaceVpcEndpointAwsService.KMS),
+}
+
+# Every endpoint is created unless the config lists a subset
+_DEFAULT_VPC_ENDPOINTS = (*_GATEWAY_ENDPOINTS, *_INTERFACE_ENDPOINTS)
 
 
 class PrimaryNetworkStack(Stack):
@@ -25,7 +55,7 @@ class PrimaryNetworkStack(Stack):
     """
 
     def __init__(
-        self, scope: Construct, construct_id: str, *, config: Dict, **kwargs
+        self, scope: Construct, construct_id: str, *, config: DRConfig, **kwargs
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
@@ -50,11 +80,13 @@ class PrimaryNetworkStack(Stack):
         """Create the VPC with public and private subnets."""
 
         # Get configuration
-        vpc_cidr = self._config.get("vpc_cidr", "10.0.0.0/16")
-        availability_zones = self._config.get("availability_zones", 2)
-        nat_gateways = self._config.get("nat_gateways", 2)
+        vpc_cidr = self._config.vpc_cidr
+        availability_zones = self._config.availability_zones
+        nat_gateways = self._config.nat_gateways
 
-        # Create VPC
+        # Create VPC. This stays an L2 Vpc: the data, app and backup stacks
+        # rely on its IVpc subnet selection API, which raw CfnVPC/CfnSubnet
+        # resources do not provide.
         self._vpc = ec2.Vpc(
             self,
             "VPC",
@@ -83,16 +115,24 @@ class PrimaryNetworkStack(Stack):
             enable_dns_support=True,
         )
 
-        # Add flow logs for monitoring
-        self._vpc.add_flow_log(
-            "FlowLog",
-            destination=ec2.FlowLogDestination.to_cloud_watch_logs(),
-            traffic_type=ec2.FlowLogTrafficType.ALL,
-        )
+        # Add flow logs for monitoring (can be disabled for throwaway test deploys)
+        if self._config.flow_logs:
+            self._vpc.add_flow_log(
+                "FlowLog",
+                destination=ec2.FlowLogDestination.to_cloud_watch_logs(),
+                traffic_type=ec2.FlowLogTrafficType.ALL,
+            )
 
     def _create_security_groups(self) -> None:
         """Create security groups for different application tiers."""
 
+        # Peers and ports shared by the ingress rules below
+        any_ipv4 = ec2.Peer.any_ipv4()
+        vpc_peer = ec2.Peer.ipv4(self._vpc.vpc_cidr_block)
+        tcp_80 = ec2.Port.tcp(80)
+        tcp_443 = ec2.Port.tcp(443)
+        tcp_5432 = ec2.Port.tcp(5432)
+
         # ALB Security Group
         self._alb_security_group = ec2.SecurityGroup(
             self,
@@ -104,14 +144,14 @@ class PrimaryNetworkStack(Stack):
 
         # Allow HTTP and HTTPS from internet
         self._alb_security_group.add_ingress_rule(
-            peer=ec2.Peer.any_ipv4(),
-            connection=ec2.Port.tcp(80),
+            peer=any_ipv4,
+            connection=tcp_80,
             description="Allow HTTP traffic from internet",
         )
 
         self._alb_security_group.add_ingress_rule(
-            peer=ec2.Peer.any_ipv4(),
-            connection=ec2.Port.tcp(443),
+            peer=any_ipv4,
+            connection=tcp_443,
             description="Allow HTTPS traffic from internet",
         )
 
@@ -127,7 +167,7 @@ class PrimaryNetworkStack(Stack):
         # Allow traffic from ALB to ECS
         self._ecs_security_group.add_ingress_rule(
             peer=self._alb_security_group,
-            connection=ec2.Port.tcp(80),
+            connection=tcp_80,
             description="Allow traffic from ALB to ECS",
         )
 
@@ -143,7 +183,7 @@ class PrimaryNetworkStack(Stack):
         # Allow PostgreSQL traffic from ECS
         self._database_security_group.add_ingress_rule(
             peer=self._ecs_security_group,
-            connection=ec2.Port.tcp(5432),
+            connection=tcp_5432,
             description="Allow PostgreSQL traffic from ECS",
         )
 
@@ -158,162 +198,102 @@ class PrimaryNetworkStack(Stack):
 
         # Allow HTTPS traffic from VPC
         self._vpc_endpoint_security_group.add_ingress_rule(
-            peer=ec2.Peer.ipv4(self._vpc.vpc_cidr_block),
-            connection=ec2.Port.tcp(443),
+            peer=vpc_peer,
+            connection=tcp_443,
             description="Allow HTTPS traffic from VPC",
         )
 
     def _create_vpc_endpoints(self) -> None:
         """Create VPC endpoints for AWS services to reduce NAT Gateway costs."""
 
-        # S3 Gateway Endpoint
-        self._vpc.add_gateway_endpoint(
-            "S3Endpoint",
-            service=ec2.GatewayVpcEndpointAwsService.S3,
-            subnets=[
-                ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
-                ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED),
-            ],
-        )
-
-        # DynamoDB Gateway Endpoint
-        self._vpc.add_gateway_endpoint(
-            "DynamoDBEndpoint",
-            service=ec2.GatewayVpcEndpointAwsService.DYNAMODB,
-            subnets=[
-                ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
-                ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED),
-            ],
-        )
-
-        # ECR API Interface Endpoint
-        self._vpc.add_interface_endpoint(
-            "ECRAPIEndpoint",
-            service=ec2.InterfaceVpcEndpointAwsService.ECR,
-            security_groups=[self._vpc_endpoint_security_group],
-            subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
-        )
-
-        # ECR Docker Interface Endpoint
-        self._vpc.add_interface_endpoint(
-            "ECRDockerEndpoint",
-            service=ec2.InterfaceVpcEndpointAwsService.ECR_DOCKER,
-            security_groups=[self._vpc_endpoint_security_group],
-            subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
-        )
-
-        # CloudWatch Logs Interface Endpoint
-        self._vpc.add_interface_endpoint(
-            "CloudWatchLogsEndpoint",
-            service=ec2.InterfaceVpcEndpointAwsService.CLOUDWATCH_LOGS,
-            security_groups=[self._vpc_endpoint_security_group],
-            subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
-        )
-
-        # Secrets Manager Interface Endpoint
-        self._vpc.add_interface_endpoint(
-            "SecretsManagerEndpoint",
-            service=ec2.InterfaceVpcEndpointAwsService.SECRETS_MANAGER,
-            security_groups=[self._vpc_endpoint_security_group],
-            subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
-        )
-
-        # KMS Interface Endpoint
-        self._vpc.add_interface_endpoint(
-            "KMSEndpoint",
-            service=ec2.InterfaceVpcEndpointAwsService.KMS,
-            security_groups=[self._vpc_endpoint_security_group],
-            subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
-        )
+        enabled = self._config.vpc_endpoints
+        if enabled is None:
+            enabled = _DEFAULT_VPC_ENDPOINTS
+        unknown = set(enabled) - set(_DEFAULT_VPC_ENDPOINTS)
+        if unknown:
+            raise ValueError(f"Unknown VPC endpoints in config: {sorted(unknown)}")
+
+        # Gateway endpoints serve both private and isolated subnets
+        gateway_subnets = [_PRIVATE_SUBNETS, _ISOLATED_SUBNETS]
+        for name, (endpoint_id, service) in _GATEWAY_ENDPOINTS.items():
+            if name in enabled:
+                self._vpc.add_gateway_endpoint(
+                    endpoint_id, service=service, subnets=gateway_subnets
+                )
+
+        # Interface endpoints live in the private subnets
+        security_groups = [self._vpc_endpoint_security_group]
+        for name, (endpoint_id, service) in _INTERFACE_ENDPOINTS.items():
+            if name in enabled:
+                self._vpc.add_interface_endpoint(
+                    endpoint_id,
+                    service=service,
+                    security_groups=security_groups,
+                    subnets=_PRIVATE_SUBNETS,
+                )
 
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs."""
 
-        CfnOutput(
-            self,
-            "VPCId",
-            value=self._vpc.vpc_id,
-            description="ID of the VPC",
-            export_name=f"{self.stack_name}-VPCId",
+        if not self._config.emit_cfn_outputs:
+            return
+
+        outputs = (
+            ("VPCId", self._vpc.vpc_id, "ID of the VPC"),
+            ("VPCCidr", self._vpc.vpc_cidr_block, "CIDR block of the VPC"),
+            # Subnet IDs for every tier, packed into one JSON output
+            (
+                "SubnetIds",
+                self.to_json_string(self.subnet_ids),
+                "JSON map of subnet IDs by tier (public, private, isolated)",
+            ),
+            # Security Group IDs
+            (
+                "ALBSecurityGroupId",
+                self._alb_security_group.security_group_id,
+                "ID of the ALB security group",
+            ),
+            (
+                "ECSSecurityGroupId",
+                self._ecs_security_group.security_group_id,
+                "ID of the ECS security group",
+            ),
+            (
+                "DatabaseSecurityGroupId",
+                self._database_security_group.security_group_id,
+                "ID of the database security group",
+            ),
         )
 
-        CfnOutput(
-            self,
-            "VPCCidr",
-            value=self._vpc.vpc_cidr_block,
-            description="CIDR block of the VPC",
-            export_name=f"{self.stack_name}-VPCCidr",
-        )
-
-        # Public subnet IDs
-        public_subnet_ids = [subnet.subnet_id for subnet in self._vpc.public_subnets]
-        CfnOutput(
-            self,
-            "PublicSubnetIds",
-            value=",".join(public_subnet_ids),
-            description="IDs of the public subnets",
-            export_name=f"{self.stack_name}-PublicSubnetIds",
-        )
-
-        # Private subnet IDs
-        private_subnet_ids = [subnet.subnet_id for subnet in self._vpc.private_subnets]
-        CfnOutput(
-            self,
-            "PrivateSubnetIds",
-            value=",".join(private_subnet_ids),
-            description="IDs of the private subnets",
-            export_name=f"{self.stack_name}-PrivateSubnetIds",
-        )
-
-        # Isolated subnet IDs
-        isolated_subnet_ids = [
-            subnet.subnet_id for subnet in self._vpc.isolated_subnets
-        ]
-        CfnOutput(
-            self,
-            "IsolatedSubnetIds",
-            value=",".join(isolated_subnet_ids),
-            description="IDs of the isolated subnets",
-            export_name=f"{self.stack_name}-IsolatedSubnetIds",
-        )
-
-        # Security Group IDs
-        CfnOutput(
-            self,
-            "ALBSecurityGroupId",
-            value=self._alb_security_group.security_group_id,
-            description="ID of the ALB security group",
-            export_name=f"{self.stack_name}-ALBSecurityGroupId",
-        )
-
-        CfnOutput(
-            self,
-            "ECSSecurityGroupId",
-            value=self._ecs_security_group.security_group_id,
-            description="ID of the ECS security group",
-            export_name=f"{self.stack_name}-ECSSecurityGroupId",
-        )
-
-        CfnOutput(
-            self,
-            "DatabaseSecurityGroupId",
-            value=self._database_security_group.security_group_id,
-            description="ID of the database security group",
-            export_name=f"{self.stack_name}-DatabaseSecurityGroupId",
-        )
+        add_outputs(self, outputs)
 
     def _add_tags(self) -> None:
         """Add tags to all resources in this stack."""
 
-        Tags.of(self).add("Component", "Network")
-        Tags.of(self).add("Region", "Primary")
-        Tags.of(self).add("Environment", "Production")
+        add_tags(
+            self,
+            {"Component": "Network", "Region": "Primary", "Environment": "Production"},
+        )
 
     @property
     def vpc(self) -> ec2.Vpc:
         """Get the VPC."""
         return self._vpc
 
+    @property
+    def subnet_ids(self) -> Dict[str, List[str]]:
+        """Get the subnet IDs of each tier, keyed by tier name."""
+        select_subnets = self._vpc.select_subnets
+        return {
+            "public": select_subnets(subnet_type=ec2.SubnetType.PUBLIC).subnet_ids,
+            "private": select_subnets(
+                subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
+            ).subnet_ids,
+            "isolated": select_subnets(
+                subnet_type=ec2.SubnetType.PRIVATE_ISOLATED
+            ).subnet_ids,
+        }
+
     @property
     def alb_security_group(self) -> ec2.SecurityGroup:
         """Get the ALB security group."""
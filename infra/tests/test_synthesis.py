@@ -1,45 +1,57 @@
 """Test CDK synthesis works correctly."""
 
-import aws_cdk as cdk
-from aws_cdk.assertions import Template
-
-from stacks.backup_stack import BackupStack
-from stacks.primary_app import PrimaryAppStack
-from stacks.primary_data import PrimaryDataStack
-from stacks.primary_network import PrimaryNetworkStack
-
-
-def test_stacks_synthesize():
-    """Test that all stacks synthesize without errors."""
-    app = cdk.App()
-
-    # Default config for testing
-    config = {
-        "primary_region": "us-east-1",
-        "secondary_region": "us-west-2",
-        "db_mode": "rds-postgres",
-        "alarm_email": "test@example.com",
-        "use_multi_region_kms": True,
-        "rto_target_hours": 4,
-        "rpo_target_hours": 4,
-        "domain_name": "app.example.com",
-        "vpc_cidr": "10.0.0.0/16",
-        "ecs_cpu": 256,
-        "ecs_memory": 512,
-        "container_image": "nginx:latest",
-        "container_port": 80,
-        "db_instance_class": "db.t3.micro",
-        "db_allocated_storage": 20,
-        "db_backup_retention": 7,
-    }
+import json
+
+import pytest
+
+from config import DRConfig
+
+# Default config for testing
+CONFIG = {
+    "primary_region": "us-east-1",
+    "secondary_region": "us-west-2",
+    "alarm_email": "test@example.com",
+    "vpc_cidr": "10.0.0.0/16",
+    "ecs_cpu": 256,
+    "ecs_memory": 512,
+    "container_image": "nginx:latest",
+    "container_port": 80,
+    "db_instance_class": "db.t3.micro",
+    "db_allocated_storage": 20,
+    "db_backup_retention": 7,
+    "primary_health_check_id": "11111111-2222-3333-4444-555555555555",
+    "status_provisioned_concurrency": 1,
+}
+
+
+def synthesize(**overrides):
+    """Build every stack from the test config and return their templates."""
+    # Imported here so collecting tests does not start the jsii runtime
+    import aws_cdk as cdk
+    from aws_cdk.assertions import Template
+
+    from stacks.backup_stack import BackupStack
+    from stacks.observability import ObservabilityStack
+    from stacks.primary_app import PrimaryAppStack
+    from stacks.primary_data import PrimaryDataStack
+    from stacks.primary_network import PrimaryNetworkStack
+
+    # Construct metadata stack traces are never inspected here and dominate
+    # synth time; CDK_DISABLE_STACK_TRACE=1 (set by make test and CI) also
+    # covers the jsii runtime
+    app = cdk.App(context={"aws:cdk:disable-stack-trace": True})
+
+    dr_config = DRConfig.from_dict({**CONFIG, **overrides})
 
     env = cdk.Environment(account="123456789012", region="us-east-1")
 
     # Create stacks
-    network_stack = PrimaryNetworkStack(app, "TestNetworkStack", env=env, config=config)
+    network_stack = PrimaryNetworkStack(
+        app, "TestNetworkStack", env=env, config=dr_config
+    )
 
     data_stack = PrimaryDataStack(
-        app, "TestDataStack", vpc=network_stack.vpc, env=env, config=config
+        app, "TestDataStack", vpc=network_stack.vpc, env=env, config=dr_config
     )
 
     app_stack = PrimaryAppStack(
@@ -49,7 +61,7 @@ def test_stacks_synthesize():
         database=data_stack.database,
         s3_bucket=data_stack.app_data_bucket,
         env=env,
-        config=config,
+        config=dr_config,
     )
 
     backup_stack = BackupStack(
@@ -59,25 +71,178 @@ def test_stacks_synthesize():
         rds_instance=data_stack.database,
         s3_bucket=data_stack.app_data_bucket,
         kms_key=data_stack.kms_key,
-        config=config,
+        config=dr_config,
         env=env,
     )
 
-    # Test synthesis
-    template_network = Template.from_stack(network_stack)
-    template_data = Template.from_stack(data_stack)
-    template_app = Template.from_stack(app_stack)
-    template_backup = Template.from_stack(backup_stack)
+    # The app has no secondary stacks yet, so the primary resources stand in
+    observability_stack = ObservabilityStack(
+        app,
+        "TestObservabilityStack",
+        primary_alb=app_stack.load_balancer,
+        secondary_alb=app_stack.load_balancer,
+        primary_database=data_stack.database,
+        secondary_database=data_stack.database.primary_instance,
+        primary_ecs_service=app_stack.ecs_service,
+        secondary_ecs_service=app_stack.ecs_service,
+        s3_buckets=[data_stack.app_data_bucket, data_stack.logs_bucket],
+        config=dr_config,
+        env=env,
+    )
+    observability_stack.add_custom_alarm(
+        "BackupJobsFailedAlarm",
+        cdk.aws_cloudwatch.Metric(
+            namespace="AWS/Backup", metric_name="NumberOfBackupJobsFailed"
+        ),
+        threshold=1,
+        evaluation_periods=1,
+        comparison_operator=(
+            cdk.aws_cloudwatch.ComparisonOperator.GREATER_THAN_OR_EQUAL_TO_THRESHOLD
+        ),
+    )
+
+    # Synthesize the whole app once and read each template from the assembly
+    assembly = app.synth()
+    stacks = {
+        "network": network_stack,
+        "data": data_stack,
+        "app": app_stack,
+        "backup": backup_stack,
+        "observability": observability_stack,
+    }
+    return {
+        name: Template.from_json(assembly.get_stack_by_name(stack.stack_name).template)
+        for name, stack in stacks.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def templates():
+    """Synthesize all stacks once and share the templates across tests."""
+    return synthesize()
 
-    # Basic assertions - just ensure key resources exist
-    template_network.has_resource_properties(
+
+def test_network_stack_synthesizes(templates):
+    """Test that the network stack creates the VPC."""
+    templates["network"].has_resource_properties(
         "AWS::EC2::VPC", {"CidrBlock": "10.0.0.0/16"}
     )
 
-    template_data.has_resource_properties(
+
+def test_stack_tags_reach_resources(templates):
+    """Test that each stack's tags are applied to its resources."""
+    from aws_cdk.assertions import Match
+
+    for name, resource_type, component in (
+        ("network", "AWS::EC2::VPC", "Network"),
+        ("data", "AWS::KMS::Key", "Data"),
+        ("app", "AWS::ECS::Cluster", "Application"),
+    ):
+        templates[name].has_resource_properties(
+            resource_type,
+            {"Tags": Match.array_with([{"Key": "Component", "Value": component}])},
+        )
+
+
+def test_data_stack_synthesizes(templates):
+    """Test that the data stack creates the PostgreSQL database."""
+    templates["data"].has_resource_properties(
         "AWS::RDS::DBInstance", {"Engine": "postgres"}
     )
 
-    template_app.has_resource_properties("AWS::ECS::Cluster", {})
 
-    template_backup.has_resource_properties("AWS::Backup::BackupPlan", {})
+def test_logs_bucket_expires_every_object(templates):
+    """Test that the logs bucket keeps one bucket-wide expiration rule."""
+    templates["data"].has_resource_properties(
+        "AWS::S3::Bucket",
+        {
+            "BucketName": "dr-lab-logs-us-east-1",
+            "LifecycleConfiguration": {
+                "Rules": [
+                    {"Id": "DeleteOldLogs", "Status": "Enabled", "ExpirationInDays": 28}
+                ]
+            },
+        },
+    )
+
+
+def test_app_stack_synthesizes(templates):
+    """Test that the app stack creates the ECS cluster."""
+    templates["app"].has_resource_properties("AWS::ECS::Cluster", {})
+
+
+def test_backup_stack_synthesizes(templates):
+    """Test that the backup stack creates the backup plan."""
+    templates["backup"].has_resource_properties("AWS::Backup::BackupPlan", {})
+
+
+def test_backup_stack_provisions_status_function(templates):
+    """Test that the stack status function gets a provisioned alias."""
+    templates["backup"].has_resource_properties(
+        "AWS::Lambda::Alias",
+        {
+            "Name": "live",
+            "ProvisionedConcurrencyConfig": {"ProvisionedConcurrentExecutions": 1},
+        },
+    )
+
+
+def test_observability_stack_synthesizes(templates):
+    """Test that the observability stack creates its dashboard and alarms."""
+    from aws_cdk.assertions import Match
+
+    template = templates["observability"]
+
+    template.resource_count_is("AWS::CloudWatch::Dashboard", 1)
+
+    # Four metric alarms, the health check alarm and one custom alarm, all
+    # notifying the monitoring topic
+    template.resource_count_is("AWS::CloudWatch::Alarm", 6)
+    template.resource_properties_count_is(
+        "AWS::CloudWatch::Alarm", {"AlarmActions": Match.any_value()}, 6
+    )
+    template.has_resource_properties(
+        "AWS::CloudWatch::Alarm",
+        {
+            "AlarmName": "dr-lab-primary-health-check-failure",
+            "MetricName": "HealthCheckStatus",
+            "Period": 60,
+            "EvaluationPeriods": 2,
+            "Dimensions": [
+                {"Name": "HealthCheckId", "Value": CONFIG["primary_health_check_id"]}
+            ],
+        },
+    )
+    template.has_resource_properties(
+        "AWS::CloudWatch::Alarm",
+        {"AlarmName": "dr-lab-primary-rds-cpu", "Threshold": 80},
+    )
+    template.has_resource_properties(
+        "AWS::CloudWatch::Alarm",
+        {"AlarmName": "dr-lab-backupjobsfailedalarm", "Threshold": 1},
+    )
+
+
+def test_stacks_synthesize_without_secondary_region():
+    """Test that a single-region config synthesizes without replication."""
+    from aws_cdk.assertions import Match
+
+    single_region = synthesize(secondary_region=None)
+
+    # No resource name or ARN is built from a missing region
+    for template in single_region.values():
+        assert "-None" not in json.dumps(template.to_json())
+
+    # The app data bucket is not replicated and secrets have no replicas
+    single_region["data"].resource_properties_count_is(
+        "AWS::S3::Bucket", {"ReplicationConfiguration": Match.any_value()}, 0
+    )
+    single_region["backup"].resource_properties_count_is(
+        "AWS::SecretsManager::Secret", {"ReplicaRegions": Match.any_value()}, 0
+    )
+
+
+def test_config_rejects_unknown_keys():
+    """Test that a misspelled config key is reported instead of ignored."""
+    with pytest.raises(ValueError, match="nat_gateway"):
+        DRConfig.from_dict({**CONFIG, "nat_gateway": 1})